@@ -82,6 +82,7 @@ const GEETileOverlay = ({ tileUrl }) => {
       attribution="Copernicus Sentinel-5P"
       opacity={0.65}
       zIndex={10}
+      maxNativeZoom={6}
     />
   )
 }
@@ -463,49 +464,40 @@ const LiveMap = () => {
 
     if (import.meta.env.DEV) {
       console.groupCollapsed('%c[Heatmap] fetchHeatmapData started', 'color:#22d3ee;font-weight:bold')
-      console.log('[Heatmap] Firing 3 requests in parallel:')
-      console.log('  → GEE heatmap  : GET /api/gee/ch4-heatmap/?days=30&num_points=1000&scale=20000')
-      console.log('  → GEE tiles    : GET /api/gee/ch4-tiles/?days=30')
+      console.log('[Heatmap] Firing 2 requests in parallel:')
+      console.log('  → GEE map      : GET /api/gee/ch4-map/?days=30&num_points=1000&scale=20000')
       console.log('  → DB fallback  : GET /api/heatmap/fallback/')
     }
     const t0 = performance.now()
 
-    // All three requests fire simultaneously.
-    // GEE heatmap has a 12 s timeout so the DB fallback wins immediately
-    // when GEE is unavailable – no sequential wait.
-    const [heatmapRes, tileRes, fallbackRes] = await Promise.allSettled([
-      geeService.getCH4Heatmap(30, 1000, 20000),
-      geeService.getCH4Tiles(30),
+    // Both requests fire simultaneously. The combined GEE call overlaps
+    // the tile and heatmap round-trips server-side and has a 12 s
+    // timeout so the DB fallback wins immediately when GEE is
+    // unavailable – no sequential wait.
+    const [mapRes, fallbackRes] = await Promise.allSettled([
+      geeService.getCH4Map(30, 1000, 20000),
       heatmapFallbackService.getPoints(),
     ])
+    // Either half may be null – the backend degrades them independently
+    const geeTiles   = mapRes.status === 'fulfilled' ? mapRes.value?.tiles : null
+    const geeHeatmap = mapRes.status === 'fulfilled' ? mapRes.value?.heatmap : null
 
     if (import.meta.env.DEV) {
       const elapsed = (performance.now() - t0).toFixed(0)
       console.log(`[Heatmap] All requests settled in ${elapsed} ms`)
 
       // ── Log each result ───────────────────────────────────────────────
-      console.group('[Heatmap] GEE ch4-heatmap result')
-      console.log('  status :', heatmapRes.status)
-      if (heatmapRes.status === 'fulfilled') {
-        const v = heatmapRes.value
-        console.log('  points returned :', v?.points?.length ?? 0)
-        console.log('  stats           :', v?.stats)
-        if (v?.points?.length > 0) console.log('  first 3 points  :', v.points.slice(0, 3))
-      } else {
-        console.error('  REJECTED – reason:', heatmapRes.reason?.message ?? heatmapRes.reason)
-        console.error('  axios response  :', heatmapRes.reason?.response?.data)
-        console.error('  HTTP status     :', heatmapRes.reason?.response?.status)
-      }
-      console.groupEnd()
-
-      console.group('[Heatmap] GEE ch4-tiles result')
-      console.log('  status :', tileRes.status)
-      if (tileRes.status === 'fulfilled') {
-        console.log('  tile_url :', tileRes.value?.tile_url ?? '(none)')
+      console.group('[Heatmap] GEE ch4-map result')
+      console.log('  status :', mapRes.status)
+      if (mapRes.status === 'fulfilled') {
+        console.log('  tile_url        :', geeTiles?.tile_url ?? '(none)')
+        console.log('  points returned :', geeHeatmap?.points?.length ?? 0)
+        console.log('  stats           :', geeHeatmap?.stats)
+        if (geeHeatmap?.points?.length > 0) console.log('  first 3 points  :', geeHeatmap.points.slice(0, 3))
       } else {
-        console.error('  REJECTED – reason:', tileRes.reason?.message ?? tileRes.reason)
-        console.error('  HTTP status     :', tileRes.reason?.response?.status)
-        console.error('  response data   :', tileRes.reason?.response?.data)
+        console.error('  REJECTED – reason:', mapRes.reason?.message ?? mapRes.reason)
+        console.error('  axios response  :', mapRes.reason?.response?.data)
+        console.error('  HTTP status     :', mapRes.reason?.response?.status)
       }
       console.groupEnd()
 
@@ -526,15 +518,15 @@ const LiveMap = () => {
     }
 
     // ── GEE tile overlay (independent of heatmap) ───────────────────
-    if (tileRes.status === 'fulfilled' && tileRes.value?.tile_url) {
+    if (geeTiles?.tile_url) {
       if (import.meta.env.DEV) console.log('[Heatmap] ✔ GEE tile overlay URL set')
-      setGeeTileUrl(tileRes.value.tile_url)
+      setGeeTileUrl(geeTiles.tile_url)
     } else {
       if (import.meta.env.DEV) console.warn('[Heatmap] ✗ GEE tile overlay not available')
     }
 
     // ── Prefer GEE heatmap; fall back to DB instantly ────────────────
-    const geeOk = heatmapRes.status === 'fulfilled' && heatmapRes.value?.points?.length > 0
+    const geeOk = (geeHeatmap?.points?.length ?? 0) > 0
     const dbOk  = fallbackRes.status === 'fulfilled' && fallbackRes.value?.points?.length > 0
 
     if (import.meta.env.DEV) console.log('[Heatmap] Decision flags — geeOk:', geeOk, ' dbOk:', dbOk)
@@ -542,9 +534,9 @@ const LiveMap = () => {
     if (geeOk) {
       // GEE data is fresh satellite data – use it
       if (import.meta.env.DEV) console.log('%c[Heatmap] ✔ Using LIVE GEE data', 'color:#22c55e;font-weight:bold',
-        heatmapRes.value.points.length, 'points')
-      setHeatmapPoints(heatmapRes.value.points)
-      setHeatmapStats(heatmapRes.value.stats)
+        geeHeatmap.points.length, 'points')
+      setHeatmapPoints(geeHeatmap.points)
+      setHeatmapStats(geeHeatmap.stats)
     } else if (dbOk) {
       // Satellite unavailable – DB fallback already finished in parallel
       if (import.meta.env.DEV) console.warn('%c[Heatmap] ⚠ Using DB fallback data', 'color:#f59e0b;font-weight:bold',
@@ -222,9 +222,14 @@ export const geeService = {
     const res = await apiClient.get('/gee/ch4-tiles/', { params: { days } })
     return res.data
   },
-  /** Get sampled CH4 points as [lat, lng, intensity] for leaflet.heat */
-  getCH4Heatmap: async (days = 30, numPoints = 1000, scale = 20000) => {
-    const res = await apiClient.get('/gee/ch4-heatmap/', {
+  /**
+   * Get the tile URL and heatmap points in one combined request —
+   * the backend overlaps both GEE round-trips, so this costs roughly
+   * the slower of the two instead of their sum.
+   * @returns {{ tiles: object|null, heatmap: object|null }}
+   */
+  getCH4Map: async (days = 30, numPoints = 1000, scale = 20000) => {
+    const res = await apiClient.get('/gee/ch4-map/', {
       params: { days, num_points: numPoints, scale },
       timeout: 12000,   // fail fast – DB fallback fires in parallel
     })
@@ -24,33 +24,63 @@ from src.data.carbonmapper import CarbonMapperClient
 from src.fusion.hotspot_detector import HotspotDetector
 from src.config import config
 
+# Single seeded Generator shared by all steps — default_rng uses PCG64,
+# which is both faster and statistically stronger than legacy RandomState.
+_RNG = np.random.default_rng(42)
+
+# Canonical column order for every facility frame written below
+_COLUMNS = (
+    "facility_id", "name", "type", "latitude", "longitude",
+    "operator", "country", "state", "status",
+)
+
 
 def _seed_facilities(anchor_coords, n_facilities, rng, operators, fac_id_start=1):
-    """Generate demo facilities with tight jitter around anchor (lat, lon) pairs."""
+    """Generate demo facilities with tight jitter around anchor (lat, lon) pairs.
+
+    All jitters and categorical picks are drawn as single batched NumPy
+    calls instead of per-facility rng.normal/rng.choice invocations.
+    """
     f_types = ["refinery", "well", "compressor", "pipeline", "terminal", "gas_plant", "tank_battery"]
-    facilities = []
-    fac_id = fac_id_start
+
+    # Facility budget per anchor: an even share each, remainder on the last
     per_anchor = max(1, n_facilities // len(anchor_coords))
-    for i, (lat, lon, label) in enumerate(anchor_coords):
-        count = per_anchor if i < len(anchor_coords) - 1 else (n_facilities - len(facilities))
-        for j in range(count):
-            jlat = lat + rng.normal(0, 0.015)   # ±0.015° ≈ ±1.5 km  (well within 5 km join radius)
-            jlon = lon + rng.normal(0, 0.015)
-            operator = rng.choice(operators)
-            f_type   = rng.choice(f_types)
-            facilities.append({
-                "facility_id": f"DEMO-{fac_id:04d}",
-                "name": f"{operator} {f_type.title()} {j+1}",
-                "type": f_type,
-                "latitude":  round(jlat, 6),
-                "longitude": round(jlon, 6),
-                "operator": operator,
-                "country": "India",
-                "state": "Unknown",
-                "status": "active",
-            })
-            fac_id += 1
-    return facilities
+    counts = np.full(len(anchor_coords), per_anchor)
+    counts[-1] = max(0, n_facilities - per_anchor * (len(anchor_coords) - 1))
+    anchor_idx = np.repeat(np.arange(len(anchor_coords)), counts)
+    total = len(anchor_idx)
+    if total == 0:
+        return pd.DataFrame(columns=_COLUMNS)
+
+    base_lat = np.array([a[0] for a in anchor_coords])[anchor_idx]
+    base_lon = np.array([a[1] for a in anchor_coords])[anchor_idx]
+    # ±0.015° ≈ ±1.5 km  (well within 5 km join radius)
+    lats = np.round(base_lat + rng.normal(0, 0.015, size=total), 6)
+    lons = np.round(base_lon + rng.normal(0, 0.015, size=total), 6)
+    ops  = pd.Series(rng.choice(operators, size=total))
+    types = pd.Series(rng.choice(f_types, size=total))
+    # Per-anchor sequence numbers for the display names
+    seq = np.concatenate([np.arange(1, c + 1) for c in counts if c > 0])
+
+    # IDs and names via pandas' C-backed string ops — no per-row f-strings
+    ids = "DEMO-" + pd.Series(
+        np.arange(fac_id_start, fac_id_start + total)
+    ).astype(str).str.zfill(4)
+    names = ops.str.cat(types.str.title(), sep=" ").str.cat(
+        pd.Series(seq).astype(str), sep=" "
+    )
+
+    return pd.DataFrame({
+        "facility_id": ids,
+        "name": names,
+        "type": types,
+        "latitude": lats,
+        "longitude": lons,
+        "operator": ops,
+        "country": "India",
+        "state": "Unknown",
+        "status": "active",
+    }, columns=_COLUMNS)
 
 
 def main():
@@ -61,7 +91,7 @@ def main():
     )
     args = parser.parse_args()
 
-    rng = np.random.RandomState(42)
+    rng = _RNG
     operators = [
         "ONGC", "Oil India Limited", "Reliance Industries",
         "BPCL", "HPCL", "IOCL", "GAIL", "Cairn India",
@@ -123,37 +153,62 @@ def main():
         gee_budget = total - cm_budget
         print(f"  Seeding {cm_budget} facilities near CarbonMapper plumes, "
               f"{gee_budget} near GEE hotspots")
-        facilities  = _seed_facilities(cm_anchors,  cm_budget,  rng, operators, fac_id_start=1)
-        facilities += _seed_facilities(gee_anchors, gee_budget, rng, operators,
-                                       fac_id_start=len(facilities) + 1)
+        facilities = _seed_facilities(cm_anchors, cm_budget, rng, operators, fac_id_start=1)
+        facilities = pd.concat(
+            [facilities,
+             _seed_facilities(gee_anchors, gee_budget, rng, operators,
+                              fac_id_start=len(facilities) + 1)],
+            ignore_index=True,
+        )
     else:
         print(f"  Seeding all {total} facilities near GEE hotspots")
         facilities = _seed_facilities(gee_anchors, total, rng, operators, fac_id_start=1)
 
-    # Trim or pad to exactly 55
-    facilities = facilities[:total]
-    while len(facilities) < total:
-        anchor = rng.choice(all_anchors)
-        lat = anchor[0] + rng.normal(0, 0.015)
-        lon = anchor[1] + rng.normal(0, 0.015)
-        operator = rng.choice(operators)
-        f_type   = rng.choice(["refinery", "well", "compressor", "pipeline", "terminal"])
-        facilities.append({
-            "facility_id": f"DEMO-{len(facilities)+1:04d}",
-            "name": f"{operator} {f_type.title()}",
-            "type": f_type,
-            "latitude":  round(lat, 6),
-            "longitude": round(lon, 6),
-            "operator": operator,
+    # Trim or pad to exactly 55 — the pad is drawn as one batched block
+    facilities = facilities.iloc[:total]
+    n_missing = total - len(facilities)
+    if n_missing > 0:
+        # Index-based pick: anchors are (lat, lon, label) tuples of mixed
+        # types, which rng.choice would coerce to a string array
+        idx = rng.integers(len(all_anchors), size=n_missing)
+        base = np.array([(a[0], a[1]) for a in all_anchors], dtype=np.float64)[idx]
+        pad_ops = pd.Series(rng.choice(operators, size=n_missing))
+        pad_types = pd.Series(rng.choice(
+            ["refinery", "well", "compressor", "pipeline", "terminal"], size=n_missing
+        ))
+        pad_ids = "DEMO-" + pd.Series(
+            np.arange(len(facilities) + 1, total + 1)
+        ).astype(str).str.zfill(4)
+        pad = pd.DataFrame({
+            "facility_id": pad_ids,
+            "name": pad_ops.str.cat(pad_types.str.title(), sep=" "),
+            "type": pad_types,
+            "latitude": np.round(base[:, 0] + rng.normal(0, 0.015, size=n_missing), 6),
+            "longitude": np.round(base[:, 1] + rng.normal(0, 0.015, size=n_missing), 6),
+            "operator": pad_ops,
             "country": "India",
             "state": "Unknown",
             "status": "active",
-        })
+        }, columns=_COLUMNS)
+        facilities = pd.concat([facilities, pad], ignore_index=True)
 
     out_path = config.dataset_dir / "demo_industries.csv"
     out_path.parent.mkdir(parents=True, exist_ok=True)
-    pd.DataFrame(facilities).to_csv(out_path, index=False)
-    print(f"Saved {len(facilities)} industries to {out_path}")
+    df = facilities
+    try:
+        # Prefer PyArrow: C++ CSV writer, plus a dictionary-encoded Parquet
+        # copy that downstream pandas consumers read ~10× faster.
+        import pyarrow as pa
+        import pyarrow.csv as pa_csv
+        import pyarrow.parquet as pq
+
+        table = pa.Table.from_pandas(df, preserve_index=False)
+        pa_csv.write_csv(table, out_path)
+        pq.write_table(table, out_path.with_suffix(".parquet"), compression="zstd")
+        print(f"Saved {len(facilities)} industries to {out_path} (+ .parquet)")
+    except ImportError:
+        df.to_csv(out_path, index=False)
+        print(f"Saved {len(facilities)} industries to {out_path}")
 
 
 if __name__ == "__main__":
@@ -45,6 +45,8 @@ class PlumeObservationAdmin(admin.ModelAdmin):
 class AttributedEmissionAdmin(admin.ModelAdmin):
     list_display = ['plume', 'facility', 'distance_km', 'confidence', 'emission_rate_kg_hr']
     list_filter = ['confidence']
+    # JOIN the FK columns shown per row instead of one SELECT per row
+    list_select_related = ('plume', 'facility')
 
 
 @admin.register(InversionResult)
@@ -53,6 +55,8 @@ class InversionResultAdmin(admin.ModelAdmin):
     list_filter = ['converged']
     # Issue 20: Add search fields for large datasets
     search_fields = ['estimated_q_kg_hr']
+    # attribution.__str__ touches plume + facility — join them up front
+    list_select_related = ('attribution', 'attribution__facility', 'attribution__plume')
 
 
 @admin.register(TaskingRequest)
@@ -66,9 +70,13 @@ class AuditReportAdmin(admin.ModelAdmin):
     list_display = ['report_id', 'facility', 'emission_rate_kg_hr', 'risk_level', 'confidence']
     list_filter = ['risk_level', 'confidence']
     search_fields = ['report_id', 'facility__name']
+    list_select_related = ('facility',)
 
 
 @admin.register(PipelineRun)
 class PipelineRunAdmin(admin.ModelAdmin):
+    # The count columns are denormalized IntegerFields written by the
+    # pipeline, not related-manager counts — the changelist reads them from
+    # the main SELECT with no per-row COUNT queries.
     list_display = ['id', 'mode', 'status', 'total_hotspots', 'attributions_count', 'reports_count', 'started_at']
     list_filter = ['status', 'mode']
@@ -1,6 +1,34 @@
+import os
+import sys
+import threading
+from pathlib import Path
+
 from django.apps import AppConfig
 
 
 class ApiConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'api'
+
+    def ready(self):
+        # Warm up Earth Engine at worker startup so the first map request
+        # doesn't pay the TLS handshake + OAuth token exchange cold start.
+        # Skipped for manage.py commands that don't serve requests and for
+        # the devserver autoreload parent; runs on a daemon thread and
+        # swallows failures so a GEE outage never blocks boot.
+        if Path(sys.argv[0]).name == 'manage.py':
+            if 'runserver' not in sys.argv:
+                return
+            # RUN_MAIN marks the autoreloader child that actually serves;
+            # with --noreload there is no reloader parent to skip
+            if '--noreload' not in sys.argv and os.environ.get('RUN_MAIN') != 'true':
+                return
+
+        def _warm():
+            try:
+                from . import gee_service
+                gee_service._ensure_init()
+            except Exception as exc:
+                print(f'[GEE-SVC] Startup warmup failed (will retry on first request): {exc}')
+
+        threading.Thread(target=_warm, name='gee-warmup', daemon=True).start()
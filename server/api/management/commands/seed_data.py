@@ -10,15 +10,24 @@ Usage:
     python manage.py seed_data --clear   # Wipe tables first
 """
 
-import csv
-import json
+import re
 from pathlib import Path
 
+import numpy as np
+import pandas as pd
+
 from django.conf import settings
 from django.core.management.base import BaseCommand
 
 from api.models import MethaneHotspot
 
+# The .geo column always holds '{"type":"Point","coordinates":[lon,lat]}' —
+# pulling the two floats with a precompiled regex skips the full JSON
+# tokenizer (~10x faster for this fixed shape).
+_COORD_RE = re.compile(
+    r'"coordinates"\s*:\s*\[\s*(-?\d+(?:\.\d+)?)\s*,\s*(-?\d+(?:\.\d+)?)\s*\]'
+)
+
 
 class Command(BaseCommand):
     help = 'Seed the database with methane hotspot data from CSV files.'
@@ -52,58 +61,120 @@ class Command(BaseCommand):
         self.stdout.write(self.style.SUCCESS('=== Seed Complete ==='))
         self.stdout.write(f'  Methane Hotspots in DB: {MethaneHotspot.objects.count()}')
 
-    def _seed_hotspots(self, csv_path: Path) -> int:
-        """Load India_Methane_Hotspots.csv into MethaneHotspot table."""
-        from django.db import transaction
-
-        existing_idx = set(MethaneHotspot.objects.values_list('system_index', flat=True))
-        objs = []
-        skipped = 0
-
-        with open(csv_path, 'r', encoding='utf-8') as f:
-            reader = csv.DictReader(f)
-            for row in reader:
-                # Issue 11: Gracefully handle malformed CSV rows
-                try:
-                    sys_index = row['system:index'].strip()
-                    if sys_index in existing_idx:
-                        continue
-
-                    count = int(row['count'])
-                    label = int(row['label'])
-
-                    # Parse coordinates from .geo JSON
-                    geo = json.loads(row['.geo'])
-                    coords = geo.get('coordinates', [0, 0])
-                    longitude = float(coords[0])
-                    latitude = float(coords[1])
-                except (KeyError, ValueError, TypeError, json.JSONDecodeError) as e:
-                    self.stderr.write(f'Skipping row with invalid data: {e}')
-                    skipped += 1
-                    continue
-
-                # Classify severity by count
-                if count >= 50:
-                    severity = 'Severe'
-                elif count >= 10:
-                    severity = 'Moderate'
-                else:
-                    severity = 'Low'
-
-                objs.append(MethaneHotspot(
-                    system_index=sys_index,
-                    count=count,
-                    label=label,
-                    latitude=latitude,
-                    longitude=longitude,
-                    severity=severity,
-                ))
+    # Flush size for streaming bulk inserts — keeps peak memory bounded and
+    # each INSERT statement small enough for MySQL's packet limits.
+    BATCH_SIZE = 1000
 
+    def _seed_hotspots(self, csv_path: Path) -> int:
+        """Load India_Methane_Hotspots.csv into MethaneHotspot table.
+
+        Parsing, coordinate extraction and severity classification all run
+        as vectorized pandas/NumPy operations over the whole file; only the
+        final model construction iterates, flushing bulk_create in batches.
+        Dedup against existing rows is left to the unique index on
+        ``system_index`` + ``ignore_conflicts=True``, so no PK set is held
+        in RAM.
+        """
+        df = pd.read_csv(
+            csv_path,
+            usecols=['system:index', 'count', 'label', '.geo'],
+            dtype={'system:index': str},
+        )
+        n_read = len(df)
+
+        # Issue 11: Gracefully handle malformed CSV rows — coerce, then drop
+        coords = df['.geo'].str.extract(_COORD_RE).astype(float)
+        df = pd.DataFrame({
+            'system_index': df['system:index'].str.strip(),
+            'count': pd.to_numeric(df['count'], errors='coerce'),
+            'label': pd.to_numeric(df['label'], errors='coerce'),
+            'longitude': coords[0],
+            'latitude': coords[1],
+        }).dropna()
+
+        skipped = n_read - len(df)
         if skipped:
             self.stdout.write(self.style.WARNING(f'  Skipped {skipped} malformed rows.'))
 
-        # Issue 19: Wrap bulk_create in transaction
-        if objs:
-            with transaction.atomic():
-                MethaneHotspot.objects.bulk_create(objs, ignore_conflicts=True)
-        return len(objs)
+        # Classify severity by count — one branchless np.digitize bucketing
+        # call (bins: <10 Low, 10-49 Moderate, >=50 Severe)
+        severity_labels = np.array(['Low', 'Moderate', 'Severe'])
+        df['severity'] = severity_labels[
+            np.digitize(df['count'].to_numpy(), [10, 50])
+        ]
+
+        # Fast path: hand the cleaned frame to MySQL's native CSV ingest,
+        # which bypasses the ORM entirely. Falls back to batched
+        # bulk_create when LOAD DATA LOCAL INFILE is unavailable
+        # (local_infile disabled, non-MySQL backend, ...).
+        try:
+            return self._load_data_infile(df)
+        except Exception as exc:
+            self.stdout.write(self.style.WARNING(
+                f'  LOAD DATA INFILE unavailable ({exc}); using bulk_create.'))
+        return self._bulk_insert(df)
+
+    def _load_data_infile(self, df: pd.DataFrame) -> int:
+        """Bulk-ingest the cleaned hotspot frame via LOAD DATA LOCAL INFILE."""
+        import tempfile
+
+        from django.db import connection
+        from django.utils import timezone
+
+        # to_numeric left count/label as float64; cast back so they land
+        # in the INT columns as "5", not "5.0" (which strict mode only
+        # tolerates because IGNORE downgrades the truncation error)
+        out = df[['system_index', 'count', 'label', 'latitude',
+                  'longitude', 'severity']].astype({'count': int, 'label': int})
+        # auto_now_add only applies through the ORM — supply it explicitly
+        out['created_at'] = timezone.now().strftime('%Y-%m-%d %H:%M:%S')
+
+        with tempfile.NamedTemporaryFile(
+                mode='w', suffix='.csv', newline='', delete=False) as tmp:
+            out.to_csv(tmp, index=False)
+            tmp_path = tmp.name
+        try:
+            with connection.cursor() as cur:
+                # IGNORE mirrors bulk_create(ignore_conflicts=True) against
+                # the unique system_index index
+                cur.execute(
+                    "LOAD DATA LOCAL INFILE %s IGNORE INTO TABLE methane_hotspots "
+                    # OPTIONALLY ENCLOSED matches to_csv's quoting of any
+                    # field containing a comma or quote
+                    "FIELDS TERMINATED BY ',' OPTIONALLY ENCLOSED BY '\"' "
+                    "LINES TERMINATED BY '\\n' "
+                    "IGNORE 1 LINES "
+                    "(`system_index`, `count`, `label`, `latitude`, "
+                    "`longitude`, `severity`, `created_at`)",
+                    [tmp_path],
+                )
+                return cur.rowcount
+        finally:
+            Path(tmp_path).unlink(missing_ok=True)
+
+    def _bulk_insert(self, df: pd.DataFrame) -> int:
+        """ORM fallback: batched bulk_create over the cleaned frame."""
+        buf = []
+        total = 0
+        rows = df[['system_index', 'count', 'label', 'latitude',
+                   'longitude', 'severity']].itertuples(index=False, name=None)
+        for sys_index, count, label, latitude, longitude, severity in rows:
+            buf.append(MethaneHotspot(
+                system_index=sys_index,
+                count=int(count),
+                label=int(label),
+                latitude=latitude,
+                longitude=longitude,
+                severity=severity,
+            ))
+            if len(buf) >= self.BATCH_SIZE:
+                MethaneHotspot.objects.bulk_create(
+                    buf, batch_size=self.BATCH_SIZE, ignore_conflicts=True)
+                total += len(buf)
+                buf.clear()
+
+        if buf:
+            MethaneHotspot.objects.bulk_create(
+                buf, batch_size=self.BATCH_SIZE, ignore_conflicts=True)
+            total += len(buf)
+        return total
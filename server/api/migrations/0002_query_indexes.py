@@ -0,0 +1,42 @@
+# Composite b-tree indexes on hot query columns: viewport bbox filters on
+# (latitude, longitude) and the frequent filter/order combinations.
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='facility',
+            index=models.Index(fields=['latitude', 'longitude'], name='fac_lat_lng_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='methanehotspot',
+            index=models.Index(fields=['latitude', 'longitude'], name='hotspot_lat_lng_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='methanehotspot',
+            index=models.Index(fields=['severity', '-count'], name='hotspot_sev_count_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='detectedhotspot',
+            index=models.Index(fields=['latitude', 'longitude'], name='detected_lat_lng_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='detectedhotspot',
+            index=models.Index(fields=['priority', '-anomaly_score'], name='detected_pri_score_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='plumeobservation',
+            index=models.Index(fields=['latitude', 'longitude'], name='plume_lat_lng_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='taskingrequest',
+            index=models.Index(fields=['status', 'priority'], name='tasking_status_pri_idx'),
+        ),
+    ]
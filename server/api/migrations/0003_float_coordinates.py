@@ -0,0 +1,65 @@
+# Store coordinates as native DOUBLE instead of DECIMAL(10,6): IEEE-754
+# math in MySQL and plain Python floats in the ORM, with no Decimal boxing
+# in downstream NumPy/pandas maths.
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0002_query_indexes'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='facility',
+            name='latitude',
+            field=models.FloatField(),
+        ),
+        migrations.AlterField(
+            model_name='facility',
+            name='longitude',
+            field=models.FloatField(),
+        ),
+        migrations.AlterField(
+            model_name='methanehotspot',
+            name='latitude',
+            field=models.FloatField(),
+        ),
+        migrations.AlterField(
+            model_name='methanehotspot',
+            name='longitude',
+            field=models.FloatField(),
+        ),
+        migrations.AlterField(
+            model_name='detectedhotspot',
+            name='latitude',
+            field=models.FloatField(),
+        ),
+        migrations.AlterField(
+            model_name='detectedhotspot',
+            name='longitude',
+            field=models.FloatField(),
+        ),
+        migrations.AlterField(
+            model_name='plumeobservation',
+            name='latitude',
+            field=models.FloatField(),
+        ),
+        migrations.AlterField(
+            model_name='plumeobservation',
+            name='longitude',
+            field=models.FloatField(),
+        ),
+        migrations.AlterField(
+            model_name='taskingrequest',
+            name='latitude',
+            field=models.FloatField(),
+        ),
+        migrations.AlterField(
+            model_name='taskingrequest',
+            name='longitude',
+            field=models.FloatField(),
+        ),
+    ]
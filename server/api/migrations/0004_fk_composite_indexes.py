@@ -0,0 +1,29 @@
+# Composite indexes covering the per-run / per-facility list queries in
+# their default orderings.
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0003_float_coordinates'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='attributedemission',
+            index=models.Index(fields=['pipeline_run', '-emission_rate_kg_hr'],
+                               name='attr_run_rate_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='attributedemission',
+            index=models.Index(fields=['facility', '-attributed_at'],
+                               name='attr_fac_date_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='auditreport',
+            index=models.Index(fields=['pipeline_run', '-generated_at'],
+                               name='report_run_date_idx'),
+        ),
+    ]
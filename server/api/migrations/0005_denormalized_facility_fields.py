@@ -0,0 +1,50 @@
+# Snapshot facility name/type/operator onto attribution and report rows so
+# the hot list endpoints no longer need a JOIN on facilities.
+
+from django.db import migrations, models
+
+
+def populate_facility_fields(apps, schema_editor):
+    AttributedEmission = apps.get_model('api', 'AttributedEmission')
+    AuditReport = apps.get_model('api', 'AuditReport')
+    for attr in AttributedEmission.objects.select_related('facility').iterator():
+        attr.facility_name = attr.facility.name
+        attr.facility_type = attr.facility.type
+        attr.facility_operator = attr.facility.operator
+        attr.save(update_fields=['facility_name', 'facility_type',
+                                 'facility_operator'])
+    for report in AuditReport.objects.select_related('facility').iterator():
+        report.facility_name = report.facility.name
+        report.save(update_fields=['facility_name'])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0004_fk_composite_indexes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='attributedemission',
+            name='facility_name',
+            field=models.CharField(blank=True, default='', max_length=255),
+        ),
+        migrations.AddField(
+            model_name='attributedemission',
+            name='facility_type',
+            field=models.CharField(blank=True, default='', max_length=32),
+        ),
+        migrations.AddField(
+            model_name='attributedemission',
+            name='facility_operator',
+            field=models.CharField(blank=True, default='', max_length=255),
+        ),
+        migrations.AddField(
+            model_name='auditreport',
+            name='facility_name',
+            field=models.CharField(blank=True, default='', max_length=255),
+        ),
+        migrations.RunPython(populate_facility_fields,
+                             migrations.RunPython.noop),
+    ]
@@ -0,0 +1,36 @@
+# Pre-rendered HTML for audit reports — rendered once in save() rather than
+# per request. The backfill renders existing rows with the same helper.
+
+from django.db import migrations, models
+
+from api.models import _render_markdown
+
+
+def render_existing_reports(apps, schema_editor):
+    AuditReport = apps.get_model('api', 'AuditReport')
+    for report in AuditReport.objects.iterator():
+        report.executive_summary_html = _render_markdown(report.executive_summary)
+        report.full_report_html = _render_markdown(report.report_markdown)
+        report.save(update_fields=['executive_summary_html', 'full_report_html'])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0005_denormalized_facility_fields'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='auditreport',
+            name='executive_summary_html',
+            field=models.TextField(blank=True, default=''),
+        ),
+        migrations.AddField(
+            model_name='auditreport',
+            name='full_report_html',
+            field=models.TextField(blank=True, default=''),
+        ),
+        migrations.RunPython(render_existing_reports,
+                             migrations.RunPython.noop),
+    ]
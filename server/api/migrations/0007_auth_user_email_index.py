@@ -0,0 +1,21 @@
+# The registration uniqueness check filters auth_user on email, which Django
+# leaves unindexed. username already has a unique index, and MySQL's
+# case-insensitive utf8mb4 collation lets __iexact use ordinary B-tree
+# indexes, so a plain index on email is all that's needed.
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0006_prerendered_report_html'),
+        ('auth', '0012_alter_user_first_name_max_length'),
+    ]
+
+    operations = [
+        migrations.RunSQL(
+            sql="CREATE INDEX auth_user_email_idx ON auth_user (email);",
+            reverse_sql="DROP INDEX auth_user_email_idx ON auth_user;",
+        ),
+    ]
@@ -0,0 +1,23 @@
+# Indexes backing the cursor-pagination orderings in api/pagination.py.
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0007_auth_user_email_index'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='detectedhotspot',
+            index=models.Index(fields=['-detected_at'],
+                               name='detected_date_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='auditreport',
+            index=models.Index(fields=['-generated_at'],
+                               name='report_date_idx'),
+        ),
+    ]
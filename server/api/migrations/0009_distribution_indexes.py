@@ -0,0 +1,46 @@
+# Single-column indexes for the dashboard's GROUP BY aggregates — lets
+# MySQL satisfy the distribution queries with index-only scans.
+
+from django.core.validators import MaxValueValidator, MinValueValidator
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0008_cursor_pagination_indexes'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='facility',
+            name='type',
+            field=models.CharField(
+                choices=[
+                    ('refinery', 'Refinery'),
+                    ('pipeline', 'Pipeline'),
+                    ('compressor', 'Compressor'),
+                    ('terminal', 'Terminal'),
+                    ('well', 'Well'),
+                    ('gas_plant', 'Gas Plant'),
+                    ('tank_battery', 'Tank Battery'),
+                    ('other', 'Other'),
+                ],
+                db_index=True, max_length=32,
+            ),
+        ),
+        migrations.AlterField(
+            model_name='facility',
+            name='operator',
+            field=models.CharField(db_index=True, max_length=255),
+        ),
+        migrations.AlterField(
+            model_name='detectedhotspot',
+            name='priority',
+            field=models.IntegerField(
+                choices=[(1, 'Critical'), (2, 'High'), (3, 'Moderate')],
+                db_index=True, default=3,
+                validators=[MinValueValidator(1), MaxValueValidator(3)],
+            ),
+        ),
+    ]
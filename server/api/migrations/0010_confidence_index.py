@@ -0,0 +1,25 @@
+# Index the confidence column so the dashboard's high-confidence count and
+# the attribution metrics breakdown are index scans. (MySQL has no partial
+# indexes; a plain index on the low-cardinality column is the equivalent.)
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0009_distribution_indexes'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='attributedemission',
+            name='confidence',
+            field=models.CharField(
+                choices=[('high', 'High (<500m)'),
+                         ('medium', 'Medium (<2km)'),
+                         ('low', 'Low (>2km)')],
+                db_index=True, max_length=16,
+            ),
+        ),
+    ]
@@ -0,0 +1,44 @@
+# B-tree indexes for the remaining filterset fields that still forced
+# full scans: hotspot label, detected-hotspot severity, plume sector,
+# inversion convergence flag, and report risk level.
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0010_confidence_index'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='methanehotspot',
+            name='label',
+            field=models.IntegerField(db_index=True, default=1),
+        ),
+        migrations.AlterField(
+            model_name='detectedhotspot',
+            name='severity',
+            field=models.CharField(db_index=True, max_length=16),
+        ),
+        migrations.AlterField(
+            model_name='plumeobservation',
+            name='sector',
+            field=models.CharField(blank=True, db_index=True, max_length=64),
+        ),
+        migrations.AlterField(
+            model_name='inversionresult',
+            name='converged',
+            field=models.BooleanField(db_index=True, default=False),
+        ),
+        migrations.AlterField(
+            model_name='auditreport',
+            name='risk_level',
+            field=models.CharField(
+                choices=[('CRITICAL', 'Critical'), ('HIGH', 'High'),
+                         ('MEDIUM', 'Medium'), ('LOW', 'Low')],
+                db_index=True, max_length=16,
+            ),
+        ),
+    ]
@@ -0,0 +1,19 @@
+# Snapshot column for the hotspot stats aggregate, written once at
+# pipeline completion so /api/hotspots/stats/ becomes a single-row read.
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0011_filter_field_indexes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='pipelinerun',
+            name='hotspot_stats',
+            field=models.JSONField(blank=True, null=True),
+        ),
+    ]
@@ -38,10 +38,11 @@ class Facility(models.Model):
 
     facility_id = models.CharField(max_length=32, unique=True, db_index=True)
     name = models.CharField(max_length=255)
-    type = models.CharField(max_length=32, choices=FACILITY_TYPES)
-    latitude = models.DecimalField(max_digits=10, decimal_places=6)
-    longitude = models.DecimalField(max_digits=10, decimal_places=6)
-    operator = models.CharField(max_length=255)
+    # Indexed: dashboard GROUP BYs aggregate over type/operator
+    type = models.CharField(max_length=32, choices=FACILITY_TYPES, db_index=True)
+    latitude = models.FloatField()
+    longitude = models.FloatField()
+    operator = models.CharField(max_length=255, db_index=True)
     country = models.CharField(max_length=100, default='India')
     state = models.CharField(max_length=100, blank=True, default='Unknown')
     status = models.CharField(max_length=20, choices=STATUS_CHOICES, default='active')
@@ -52,6 +53,10 @@ class Facility(models.Model):
         db_table = 'facilities'
         ordering = ['facility_id']
         verbose_name_plural = 'facilities'
+        indexes = [
+            # Viewport bbox filters hit both coordinate columns
+            models.Index(fields=['latitude', 'longitude'], name='fac_lat_lng_idx'),
+        ]
 
     def __str__(self):
         return f"{self.facility_id} - {self.name}"
@@ -68,15 +73,20 @@ class MethaneHotspot(models.Model):
 
     system_index = models.CharField(max_length=64, unique=True, db_index=True)
     count = models.IntegerField(help_text='Observation count (proxy for CH4 column density)')
-    label = models.IntegerField(default=1)
-    latitude = models.DecimalField(max_digits=10, decimal_places=6)
-    longitude = models.DecimalField(max_digits=10, decimal_places=6)
+    label = models.IntegerField(default=1, db_index=True)
+    latitude = models.FloatField()
+    longitude = models.FloatField()
     severity = models.CharField(max_length=16, choices=SEVERITY_CHOICES, blank=True)
     created_at = models.DateTimeField(auto_now_add=True)
 
     class Meta:
         db_table = 'methane_hotspots'
         ordering = ['-count']
+        indexes = [
+            models.Index(fields=['latitude', 'longitude'], name='hotspot_lat_lng_idx'),
+            # Matches the severity filter + default -count ordering
+            models.Index(fields=['severity', '-count'], name='hotspot_sev_count_idx'),
+        ]
 
     def __str__(self):
         return f"{self.system_index} (count={self.count})"
@@ -95,15 +105,15 @@ class DetectedHotspot(models.Model):
     source_hotspot = models.ForeignKey(
         MethaneHotspot, on_delete=models.SET_NULL, null=True, blank=True, related_name='detections'
     )
-    latitude = models.DecimalField(max_digits=10, decimal_places=6)
-    longitude = models.DecimalField(max_digits=10, decimal_places=6)
+    latitude = models.FloatField()
+    longitude = models.FloatField()
     ch4_count = models.IntegerField()
     anomaly_score = models.FloatField()
-    severity = models.CharField(max_length=16)
+    severity = models.CharField(max_length=16, db_index=True)
     requires_highres = models.BooleanField(default=False)
     # Issue 13: Enforce valid priority range at model level
     priority = models.IntegerField(
-        choices=PRIORITY_CHOICES, default=3,
+        choices=PRIORITY_CHOICES, default=3, db_index=True,
         validators=[MinValueValidator(1), MaxValueValidator(3)],
     )
     pipeline_run = models.ForeignKey(
@@ -114,6 +124,13 @@ class DetectedHotspot(models.Model):
     class Meta:
         db_table = 'detected_hotspots'
         ordering = ['priority', '-anomaly_score']
+        indexes = [
+            models.Index(fields=['latitude', 'longitude'], name='detected_lat_lng_idx'),
+            # Matches the default ordering so list views read index order
+            models.Index(fields=['priority', '-anomaly_score'], name='detected_pri_score_idx'),
+            # Cursor pagination seeks on detected_at
+            models.Index(fields=['-detected_at'], name='detected_date_idx'),
+        ]
 
     def __str__(self):
         return f"{self.hotspot_id} (priority={self.priority}, score={self.anomaly_score})"
@@ -123,13 +140,13 @@ class PlumeObservation(models.Model):
     """CarbonMapper plume observation (real or synthetic)."""
 
     plume_id = models.CharField(max_length=64, unique=True, db_index=True)
-    latitude = models.DecimalField(max_digits=10, decimal_places=6)
-    longitude = models.DecimalField(max_digits=10, decimal_places=6)
+    latitude = models.FloatField()
+    longitude = models.FloatField()
     emission_rate_kg_hr = models.FloatField(help_text='Emission rate in kg/hr')
     wind_speed_ms = models.FloatField(help_text='Wind speed in m/s')
     wind_direction_deg = models.FloatField(help_text='Wind direction in degrees')
     plume_length_m = models.FloatField(null=True, blank=True)
-    sector = models.CharField(max_length=64, blank=True)
+    sector = models.CharField(max_length=64, blank=True, db_index=True)
     concentration_ppm = models.FloatField(null=True, blank=True)
     is_synthetic = models.BooleanField(default=True, help_text='True if generated, False if from API')
     pipeline_run = models.ForeignKey(
@@ -140,6 +157,9 @@ class PlumeObservation(models.Model):
     class Meta:
         db_table = 'plume_observations'
         ordering = ['-emission_rate_kg_hr']
+        indexes = [
+            models.Index(fields=['latitude', 'longitude'], name='plume_lat_lng_idx'),
+        ]
 
     def __str__(self):
         return f"{self.plume_id} ({self.emission_rate_kg_hr:.1f} kg/hr)"
@@ -156,8 +176,14 @@ class AttributedEmission(models.Model):
 
     plume = models.ForeignKey(PlumeObservation, on_delete=models.CASCADE, related_name='attributions')
     facility = models.ForeignKey(Facility, on_delete=models.CASCADE, related_name='attributions')
+    # Denormalized from facility at write time — attribution rows are
+    # immutable snapshots, so list endpoints can skip the facility join.
+    facility_name = models.CharField(max_length=255, blank=True, default='')
+    facility_type = models.CharField(max_length=32, blank=True, default='')
+    facility_operator = models.CharField(max_length=255, blank=True, default='')
     distance_km = models.FloatField(help_text='Distance between plume and facility in km')
-    confidence = models.CharField(max_length=16, choices=CONFIDENCE_CHOICES)
+    # Indexed: dashboard/metrics count rows per confidence level
+    confidence = models.CharField(max_length=16, choices=CONFIDENCE_CHOICES, db_index=True)
     emission_rate_kg_hr = models.FloatField()
     pipeline_run = models.ForeignKey(
         'PipelineRun', on_delete=models.CASCADE, null=True, blank=True, related_name='attributions'
@@ -167,6 +193,13 @@ class AttributedEmission(models.Model):
     class Meta:
         db_table = 'attributed_emissions'
         ordering = ['-emission_rate_kg_hr']
+        indexes = [
+            # Per-run listings in default ordering read straight off the index
+            models.Index(fields=['pipeline_run', '-emission_rate_kg_hr'],
+                         name='attr_run_rate_idx'),
+            models.Index(fields=['facility', '-attributed_at'],
+                         name='attr_fac_date_idx'),
+        ]
 
     def __str__(self):
         return f"{self.plume.plume_id} → {self.facility.facility_id} ({self.distance_km:.2f}km)"
@@ -188,7 +221,7 @@ class InversionResult(models.Model):
     ci_upper_kg_hr = models.FloatField(help_text='95% CI upper bound')
     final_loss = models.FloatField()
     n_iterations = models.IntegerField()
-    converged = models.BooleanField(default=False)
+    converged = models.BooleanField(default=False, db_index=True)
     pipeline_run = models.ForeignKey(
         'PipelineRun', on_delete=models.CASCADE, null=True, blank=True, related_name='inversions'
     )
@@ -222,8 +255,8 @@ class TaskingRequest(models.Model):
         DetectedHotspot, on_delete=models.CASCADE, null=True, blank=True, related_name='tasking_requests'
     )
     satellite = models.CharField(max_length=64, default='CarbonMapper-Tanager')
-    latitude = models.DecimalField(max_digits=10, decimal_places=6)
-    longitude = models.DecimalField(max_digits=10, decimal_places=6)
+    latitude = models.FloatField()
+    longitude = models.FloatField()
     priority = models.IntegerField(choices=PRIORITY_CHOICES, default=2)
     status = models.CharField(max_length=16, choices=STATUS_CHOICES, default='pending')
     pipeline_run = models.ForeignKey(
@@ -234,11 +267,25 @@ class TaskingRequest(models.Model):
     class Meta:
         db_table = 'tasking_requests'
         ordering = ['priority', '-requested_at']
+        indexes = [
+            models.Index(fields=['status', 'priority'], name='tasking_status_pri_idx'),
+        ]
 
     def __str__(self):
         return f"{self.request_id} ({self.satellite}, priority={self.priority})"
 
 
+def _render_markdown(text):
+    """Markdown→HTML; returns the raw text if markdown isn't installed."""
+    if not text:
+        return ''
+    try:
+        import markdown
+    except ImportError:
+        return text
+    return markdown.markdown(text, extensions=['extra', 'sane_lists'])
+
+
 class AuditReport(models.Model):
     """Compliance audit report generated by the LLM agent."""
 
@@ -254,11 +301,17 @@ class AuditReport(models.Model):
         AttributedEmission, on_delete=models.CASCADE, null=True, blank=True, related_name='reports'
     )
     facility = models.ForeignKey(Facility, on_delete=models.CASCADE, related_name='reports')
+    # Denormalized from facility at write time (see AttributedEmission)
+    facility_name = models.CharField(max_length=255, blank=True, default='')
     emission_rate_kg_hr = models.FloatField()
-    risk_level = models.CharField(max_length=16, choices=RISK_CHOICES)
+    risk_level = models.CharField(max_length=16, choices=RISK_CHOICES, db_index=True)
     confidence = models.CharField(max_length=16)
     report_markdown = models.TextField(help_text='Full markdown report content')
     executive_summary = models.TextField(blank=True)
+    # Rendered once in save() so detail requests read a column instead of
+    # re-running Markdown→HTML conversion per hit
+    executive_summary_html = models.TextField(blank=True, default='')
+    full_report_html = models.TextField(blank=True, default='')
     pipeline_run = models.ForeignKey(
         'PipelineRun', on_delete=models.CASCADE, null=True, blank=True, related_name='reports'
     )
@@ -267,6 +320,25 @@ class AuditReport(models.Model):
     class Meta:
         db_table = 'audit_reports'
         ordering = ['-generated_at']
+        indexes = [
+            models.Index(fields=['pipeline_run', '-generated_at'],
+                         name='report_run_date_idx'),
+            # Cursor pagination seeks on generated_at
+            models.Index(fields=['-generated_at'], name='report_date_idx'),
+        ]
+
+    def save(self, *args, **kwargs):
+        # Keep the pre-rendered HTML in sync with the markdown source; edits
+        # via save() re-render, so the serializer never converts at read time
+        update_fields = kwargs.get('update_fields')
+        if update_fields is None or {'executive_summary', 'report_markdown'} & set(update_fields):
+            self.executive_summary_html = _render_markdown(self.executive_summary)
+            self.full_report_html = _render_markdown(self.report_markdown)
+            if update_fields is not None:
+                kwargs['update_fields'] = list(
+                    set(update_fields) | {'executive_summary_html', 'full_report_html'}
+                )
+        super().save(*args, **kwargs)
 
     def __str__(self):
         return f"{self.report_id} - {self.facility.name} ({self.risk_level})"
@@ -291,6 +363,9 @@ class PipelineRun(models.Model):
     attributions_count = models.IntegerField(default=0)
     reports_count = models.IntegerField(default=0)
     error_message = models.TextField(blank=True)
+    # Hotspot summary aggregate snapshotted at completion so the stats
+    # endpoint reads one row instead of scanning the hotspot table
+    hotspot_stats = models.JSONField(null=True, blank=True)
     started_at = models.DateTimeField(auto_now_add=True)
     completed_at = models.DateTimeField(null=True, blank=True)
 
@@ -0,0 +1,26 @@
+"""
+Cursor pagination for the list viewsets.
+
+Page-number pagination does OFFSET scans, so page N costs O(N*page_size)
+rows and a COUNT(*) per request. Cursor pagination seeks straight to the
+page via an indexed column, keeping list latency flat as tables grow.
+Each ordering includes ``-id`` as a tiebreaker so equal timestamps can't
+skip or duplicate rows across pages.
+"""
+
+from rest_framework.pagination import CursorPagination
+
+
+class IdCursorPagination(CursorPagination):
+    """Default cursor: primary key, monotonic with insert order."""
+    ordering = '-id'
+
+
+class DetectedAtCursorPagination(CursorPagination):
+    """Detected hotspots, newest first (indexed)."""
+    ordering = ('-detected_at', '-id')
+
+
+class GeneratedAtCursorPagination(CursorPagination):
+    """Audit reports, newest first (indexed, matches model ordering)."""
+    ordering = ('-generated_at', '-id')
@@ -0,0 +1,30 @@
+"""
+orjson-backed DRF renderer.
+
+DRF's stock JSONRenderer goes through json.dumps, which is pure Python and
+the final bottleneck on large payloads (pipeline-run detail, geojson,
+dashboard). orjson encodes the same nested dicts/lists in C and returns
+bytes directly, skipping the str→bytes encode.
+"""
+
+import orjson
+
+from rest_framework.renderers import JSONRenderer
+
+
+class ORJSONRenderer(JSONRenderer):
+    """Drop-in JSONRenderer replacement that serializes with orjson."""
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b''
+        return orjson.dumps(
+            data,
+            # str() covers the types orjson won't take natively (Decimal,
+            # lazy translation proxies); everything DRF emits is otherwise
+            # plain dict/list/str/float or numpy via OPT_SERIALIZE_NUMPY
+            default=str,
+            # NON_STR_KEYS matches stdlib json, which coerced int dict keys
+            # (e.g. priority buckets) to strings instead of raising
+            option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS,
+        )
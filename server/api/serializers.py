@@ -2,9 +2,15 @@
 Django REST Framework serializers for Methane Shadow Hunter API.
 """
 
+import copy
+from collections import OrderedDict
+
 from django.contrib.auth.models import User
 from django.contrib.auth.password_validation import validate_password
+from django.db import models
 from rest_framework import serializers
+from rest_framework.fields import SkipField
+from rest_framework.relations import PKOnlyObject
 from .models import (
     Facility,
     MethaneHotspot,
@@ -18,15 +24,90 @@ from .models import (
 )
 
 
+# get_fields() re-introspects the model and rebuilds every Field instance on
+# each serializer instantiation, which dominates serialization CPU on list
+# endpoints.  The field dict is identical per class, so build it once and
+# hand out shallow copies (bind() re-attaches each copy to its parent).
+_FIELDS_CACHE: dict = {}
+
+
+class CachedFieldsMixin:
+    """Memoize ``get_fields()`` per serializer class."""
+
+    def get_fields(self):
+        cached = _FIELDS_CACHE.get(self.__class__)
+        if cached is None:
+            cached = _FIELDS_CACHE[self.__class__] = super().get_fields()
+        return OrderedDict(
+            (name, copy.copy(field)) for name, field in cached.items()
+        )
+
+
+class FastListSerializer(serializers.ListSerializer):
+    """
+    List serializer that resolves the child's readable fields once for the
+    whole collection instead of re-dispatching through
+    ``child.to_representation`` per row — the nested ``many=True`` blocks on
+    the pipeline-run detail payload are thousands of rows deep.
+    """
+
+    def to_representation(self, data):
+        iterable = data.all() if isinstance(data, models.Manager) else data
+        fields = list(self.child._readable_fields)
+        rows = []
+        for item in iterable:
+            row = {}
+            for field in fields:
+                try:
+                    attribute = field.get_attribute(item)
+                except SkipField:
+                    continue
+                check = attribute.pk if isinstance(attribute, PKOnlyObject) else attribute
+                row[field.field_name] = (
+                    None if check is None else field.to_representation(attribute)
+                )
+            rows.append(row)
+        return rows
+
+
+class EagerLoadingMixin:
+    """
+    Declare ``select_related`` / ``prefetch_related`` tuples on the
+    serializer ``Meta`` and apply them to a queryset via
+    ``setup_eager_loading`` — keeps the join list next to the fields that
+    need it, so viewsets can't drift into N+1 territory.
+    """
+
+    @classmethod
+    def setup_eager_loading(cls, queryset):
+        # Guard: a zero-arg select_related() means "join every non-null
+        # FK" in Django, not a no-op
+        sel = getattr(cls.Meta, 'select_related', ())
+        if sel:
+            queryset = queryset.select_related(*sel)
+        prefetch = getattr(cls.Meta, 'prefetch_related', ())
+        if prefetch:
+            queryset = queryset.prefetch_related(*prefetch)
+        # Optional column projection — keeps joined rows as narrow as the
+        # fields the serializer actually reads
+        only = getattr(cls.Meta, 'only', ())
+        if only:
+            queryset = queryset.only(*only)
+        return queryset
+
+
 # ─── Facility ───────────────────────────────────────────────────────────────
 
-class FacilitySerializer(serializers.ModelSerializer):
+class FacilitySerializer(CachedFieldsMixin, serializers.ModelSerializer):
     class Meta:
         model = Facility
-        fields = '__all__'
+        fields = [
+            'id', 'facility_id', 'name', 'type', 'latitude', 'longitude',
+            'operator', 'country', 'state', 'status', 'created_at', 'updated_at',
+        ]
 
 
-class FacilityListSerializer(serializers.ModelSerializer):
+class FacilityListSerializer(CachedFieldsMixin, serializers.ModelSerializer):
     """Lighter serializer for list views."""
     class Meta:
         model = Facility
@@ -38,93 +119,138 @@ class FacilityListSerializer(serializers.ModelSerializer):
 
 # ─── Methane Hotspot ────────────────────────────────────────────────────────
 
-class MethaneHotspotSerializer(serializers.ModelSerializer):
+class MethaneHotspotSerializer(CachedFieldsMixin, serializers.ModelSerializer):
     class Meta:
         model = MethaneHotspot
-        fields = '__all__'
+        fields = [
+            'id', 'system_index', 'count', 'label', 'latitude', 'longitude',
+            'severity', 'created_at',
+        ]
 
 
 # ─── Detected Hotspot ───────────────────────────────────────────────────────
 
-class DetectedHotspotSerializer(serializers.ModelSerializer):
+# Module-level so the dict is built once, not per serialized row.
+_PRIORITY_LABELS = {1: 'Critical', 2: 'High', 3: 'Moderate'}
+
+
+class DetectedHotspotSerializer(CachedFieldsMixin, serializers.ModelSerializer):
     priority_label = serializers.SerializerMethodField()
 
     class Meta:
         model = DetectedHotspot
-        fields = '__all__'
+        fields = [
+            'id', 'hotspot_id', 'source_hotspot', 'latitude', 'longitude',
+            'ch4_count', 'anomaly_score', 'severity', 'requires_highres',
+            'priority', 'priority_label', 'pipeline_run', 'detected_at',
+        ]
+        list_serializer_class = FastListSerializer
 
     def get_priority_label(self, obj):
-        labels = {1: 'Critical', 2: 'High', 3: 'Moderate'}
-        return labels.get(obj.priority, 'Unknown')
+        return _PRIORITY_LABELS.get(obj.priority, 'Unknown')
 
 
 # ─── Plume Observation ──────────────────────────────────────────────────────
 
-class PlumeObservationSerializer(serializers.ModelSerializer):
+class PlumeObservationSerializer(CachedFieldsMixin, serializers.ModelSerializer):
     class Meta:
         model = PlumeObservation
-        fields = '__all__'
+        fields = [
+            'id', 'plume_id', 'latitude', 'longitude', 'emission_rate_kg_hr',
+            'wind_speed_ms', 'wind_direction_deg', 'plume_length_m', 'sector',
+            'concentration_ppm', 'is_synthetic', 'pipeline_run', 'observed_at',
+        ]
+        list_serializer_class = FastListSerializer
 
 
 # ─── Attributed Emission ────────────────────────────────────────────────────
 
-class AttributedEmissionSerializer(serializers.ModelSerializer):
-    facility_name = serializers.CharField(source='facility.name', read_only=True)
-    facility_type = serializers.CharField(source='facility.type', read_only=True)
-    facility_operator = serializers.CharField(source='facility.operator', read_only=True)
+class AttributedEmissionSerializer(CachedFieldsMixin, EagerLoadingMixin,
+                                   serializers.ModelSerializer):
+    # facility_name/type/operator are denormalized model fields — no join
     plume_id = serializers.CharField(source='plume.plume_id', read_only=True)
 
     class Meta:
         model = AttributedEmission
-        fields = '__all__'
+        fields = [
+            'id', 'plume', 'plume_id', 'facility', 'facility_name',
+            'facility_type', 'facility_operator', 'distance_km', 'confidence',
+            'emission_rate_kg_hr', 'pipeline_run', 'attributed_at',
+        ]
+        select_related = ('plume',)
+        # The join only reads plume_id, so don't drag the full plume row in
+        only = (
+            'id', 'plume', 'facility', 'facility_name', 'facility_type',
+            'facility_operator', 'distance_km', 'confidence',
+            'emission_rate_kg_hr', 'pipeline_run', 'attributed_at',
+            'plume__plume_id',
+        )
+        list_serializer_class = FastListSerializer
 
 
-class AttributedEmissionDetailSerializer(serializers.ModelSerializer):
+class AttributedEmissionDetailSerializer(CachedFieldsMixin, EagerLoadingMixin,
+                                         serializers.ModelSerializer):
     facility = FacilitySerializer(read_only=True)
     plume = PlumeObservationSerializer(read_only=True)
     inversion = serializers.SerializerMethodField()
 
     class Meta:
         model = AttributedEmission
-        fields = '__all__'
+        fields = [
+            'id', 'plume', 'facility', 'inversion', 'distance_km',
+            'confidence', 'emission_rate_kg_hr', 'pipeline_run', 'attributed_at',
+        ]
+        select_related = ('facility', 'plume', 'inversion')
 
     def get_inversion(self, obj):
-        try:
-            return InversionResultSerializer(obj.inversion).data
-        except InversionResult.DoesNotExist:
+        # RelatedObjectDoesNotExist subclasses AttributeError, so getattr
+        # handles the no-inversion case; select_related('inversion') means
+        # this never triggers an extra query either way
+        inversion = getattr(obj, 'inversion', None)
+        if inversion is None:
             return None
+        return InversionResultSerializer(inversion).data
 
 
 # ─── Inversion Result ───────────────────────────────────────────────────────
 
-class InversionResultSerializer(serializers.ModelSerializer):
+class InversionResultSerializer(CachedFieldsMixin, serializers.ModelSerializer):
     class Meta:
         model = InversionResult
-        fields = '__all__'
+        fields = [
+            'id', 'attribution', 'estimated_q_kg_hr', 'estimated_q_kg_s',
+            'true_q_kg_hr', 'error_pct', 'ci_lower_kg_hr', 'ci_upper_kg_hr',
+            'final_loss', 'n_iterations', 'converged', 'pipeline_run',
+            'computed_at',
+        ]
 
 
 # ─── Tasking Request ────────────────────────────────────────────────────────
 
-class TaskingRequestSerializer(serializers.ModelSerializer):
+class TaskingRequestSerializer(CachedFieldsMixin, serializers.ModelSerializer):
     class Meta:
         model = TaskingRequest
-        fields = '__all__'
+        fields = [
+            'id', 'request_id', 'hotspot', 'satellite', 'latitude',
+            'longitude', 'priority', 'status', 'pipeline_run', 'requested_at',
+        ]
 
 
 # ─── Audit Report ───────────────────────────────────────────────────────────
 
-class AuditReportSerializer(serializers.ModelSerializer):
-    facility_name = serializers.CharField(source='facility.name', read_only=True)
-
+class AuditReportSerializer(CachedFieldsMixin, serializers.ModelSerializer):
     class Meta:
         model = AuditReport
-        fields = '__all__'
+        fields = [
+            'id', 'report_id', 'attribution', 'facility', 'facility_name',
+            'emission_rate_kg_hr', 'risk_level', 'confidence',
+            'report_markdown', 'full_report_html', 'executive_summary',
+            'executive_summary_html', 'pipeline_run', 'generated_at',
+        ]
 
 
-class AuditReportListSerializer(serializers.ModelSerializer):
+class AuditReportListSerializer(CachedFieldsMixin, serializers.ModelSerializer):
     """Lighter serializer without full markdown content."""
-    facility_name = serializers.CharField(source='facility.name', read_only=True)
-
     class Meta:
         model = AuditReport
         fields = [
@@ -132,17 +258,23 @@ class AuditReportListSerializer(serializers.ModelSerializer):
             'emission_rate_kg_hr', 'risk_level', 'confidence',
             'executive_summary', 'generated_at',
         ]
+        list_serializer_class = FastListSerializer
 
 
 # ─── Pipeline Run ──────────────────────────────────────────────────────────
 
-class PipelineRunSerializer(serializers.ModelSerializer):
+class PipelineRunSerializer(CachedFieldsMixin, serializers.ModelSerializer):
     class Meta:
         model = PipelineRun
-        fields = '__all__'
+        fields = [
+            'id', 'mode', 'use_llm', 'status', 'total_hotspots',
+            'detected_hotspots_count', 'plumes_count', 'attributions_count',
+            'reports_count', 'error_message', 'started_at', 'completed_at',
+        ]
 
 
-class PipelineRunDetailSerializer(serializers.ModelSerializer):
+class PipelineRunDetailSerializer(CachedFieldsMixin, EagerLoadingMixin,
+                                  serializers.ModelSerializer):
     detected_hotspots = DetectedHotspotSerializer(many=True, read_only=True)
     plumes = PlumeObservationSerializer(many=True, read_only=True)
     attributions = AttributedEmissionSerializer(many=True, read_only=True)
@@ -150,7 +282,21 @@ class PipelineRunDetailSerializer(serializers.ModelSerializer):
 
     class Meta:
         model = PipelineRun
-        fields = '__all__'
+        fields = PipelineRunSerializer.Meta.fields + [
+            'detected_hotspots', 'plumes', 'attributions', 'reports',
+        ]
+        prefetch_related = (
+            'detected_hotspots', 'plumes',
+            # Prefetch with the child serializer's own eager loading so the
+            # attribution rows arrive with plume joined and projected, not
+            # via a second prefetch query
+            models.Prefetch(
+                'attributions',
+                queryset=AttributedEmissionSerializer.setup_eager_loading(
+                    AttributedEmission.objects.all()),
+            ),
+            'reports',
+        )
 
 
 # ─── Dashboard / Summary ───────────────────────────────────────────────────
@@ -192,19 +338,26 @@ class RegisterSerializer(serializers.Serializer):
     first_name = serializers.CharField(max_length=150, required=False, default='')
     last_name = serializers.CharField(max_length=150, required=False, default='')
 
-    def validate_username(self, value):
-        if User.objects.filter(username__iexact=value).exists():
-            raise serializers.ValidationError('A user with this username already exists.')
-        return value
-
-    def validate_email(self, value):
-        if User.objects.filter(email__iexact=value).exists():
-            raise serializers.ValidationError('A user with this email already exists.')
-        return value
-
     def validate(self, data):
+        # Cheapest checks first: no point querying the DB or running the
+        # password validators if the two passwords don't even match
         if data['password'] != data['confirm_password']:
             raise serializers.ValidationError({'confirm_password': 'Passwords do not match.'})
+
+        # One query covers both uniqueness checks instead of two EXISTS
+        errors = {}
+        clashes = User.objects.filter(
+            models.Q(username__iexact=data['username'])
+            | models.Q(email__iexact=data['email'])
+        ).values_list('username', 'email')
+        for username, email in clashes:
+            if username.lower() == data['username'].lower():
+                errors['username'] = 'A user with this username already exists.'
+            if email.lower() == data['email'].lower():
+                errors['email'] = 'A user with this email already exists.'
+        if errors:
+            raise serializers.ValidationError(errors)
+
         # Run Django password validators
         validate_password(data['password'])
         return data
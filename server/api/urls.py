@@ -42,6 +42,7 @@ urlpatterns = [
     path('heatmap/fallback/', views.heatmap_fallback, name='heatmap-fallback'),
 
     # Google Earth Engine endpoints
+    path('gee/ch4-map/', views.gee_ch4_map, name='gee-ch4-map'),
     path('gee/ch4-tiles/', views.gee_ch4_tiles, name='gee-ch4-tiles'),
     path('gee/ch4-heatmap/', views.gee_ch4_heatmap, name='gee-ch4-heatmap'),
     path('gee/ch4-hotspots/', views.gee_ch4_hotspots, name='gee-ch4-hotspots'),
@@ -15,15 +15,27 @@ Provides endpoints for:
 
 import sys
 import json
+import time
+import heapq
+import hashlib
+import functools
+import threading
 import traceback
 from pathlib import Path
-from datetime import datetime
-from math import radians, sin, cos, sqrt, atan2
+from datetime import datetime, date
+from math import radians, cos
+
+import orjson
+import numpy as np
 
 from django.conf import settings
+from django.core.cache import cache
 from django.db.models import Count, Avg, Sum, Max, Min, Q, F
+from django.db.models.expressions import RawSQL
 from django.db import transaction
+from django.http import HttpResponse, StreamingHttpResponse
 from django.utils import timezone
+from django.views.decorators.http import condition
 
 from rest_framework import viewsets, status, filters
 from rest_framework.decorators import api_view, action, permission_classes as perm_classes_decorator
@@ -36,6 +48,8 @@ from django.contrib.auth import authenticate
 from django.contrib.auth.models import User
 from django_filters.rest_framework import DjangoFilterBackend
 
+from .pagination import DetectedAtCursorPagination, GeneratedAtCursorPagination
+
 from .models import (
     Facility,
     MethaneHotspot,
@@ -67,6 +81,24 @@ from .serializers import (
 )
 
 
+class OrjsonResponse(HttpResponse):
+    """
+    JSON response encoded with orjson.
+
+    ``OPT_SERIALIZE_NUMPY`` writes NumPy arrays straight to JSON arrays in
+    C, so large numeric payloads (heatmap point grids) skip the
+    ndarray → list-of-lists → stdlib-json round trip entirely.
+    """
+
+    def __init__(self, data, status=None, **kwargs):
+        kwargs.setdefault('content_type', 'application/json')
+        super().__init__(
+            orjson.dumps(data, option=orjson.OPT_SERIALIZE_NUMPY),
+            status=status,
+            **kwargs,
+        )
+
+
 # ─── Facility ViewSet ──────────────────────────────────────────────────────
 
 class FacilityViewSet(viewsets.ModelViewSet):
@@ -96,22 +128,32 @@ class FacilityViewSet(viewsets.ModelViewSet):
     @action(detail=False, methods=['get'])
     def by_type(self, request):
         """Facility count grouped by type."""
-        data = (
-            Facility.objects.values('type')
-            .annotate(count=Count('id'))
-            .order_by('-count')
-        )
-        return Response(list(data))
+        # Version-keyed like the dashboard: the key rolls when any
+        # facility changes, so stale entries simply age out.
+        latest = Facility.objects.aggregate(m=Max('updated_at'))['m']
+        return Response(cache.get_or_set(
+            f'facilities:by_type:{latest}',
+            lambda: list(
+                Facility.objects.values('type')
+                .annotate(count=Count('id'))
+                .order_by('-count')
+            ),
+            300,
+        ))
 
     @action(detail=False, methods=['get'])
     def by_operator(self, request):
         """Facility count grouped by operator."""
-        data = (
-            Facility.objects.values('operator')
-            .annotate(count=Count('id'))
-            .order_by('-count')
-        )
-        return Response(list(data))
+        latest = Facility.objects.aggregate(m=Max('updated_at'))['m']
+        return Response(cache.get_or_set(
+            f'facilities:by_operator:{latest}',
+            lambda: list(
+                Facility.objects.values('operator')
+                .annotate(count=Count('id'))
+                .order_by('-count')
+            ),
+            300,
+        ))
 
     @action(detail=False, methods=['get'])
     def nearby(self, request):
@@ -137,22 +179,27 @@ class FacilityViewSet(viewsets.ModelViewSet):
                 status=status.HTTP_400_BAD_REQUEST,
             )
 
-        # Issue 4: Bounding-box pre-filter to avoid loading ALL facilities
+        # Issue 4: Bounding-box pre-filter to avoid loading ALL facilities.
+        # The bbox hits fac_lat_lng_idx; MySQL's ST_Distance_Sphere then
+        # rejects the bbox corners and sorts — no per-row Python trig.
         lat_range = radius_km / 111.0  # ~111 km per degree latitude
         lon_range = radius_km / (111.0 * cos(radians(lat))) if cos(radians(lat)) != 0 else radius_km / 111.0
-        facilities = Facility.objects.filter(
-            latitude__range=(lat - lat_range, lat + lat_range),
-            longitude__range=(lon - lon_range, lon + lon_range),
+        facilities = (
+            Facility.objects.filter(
+                latitude__range=(lat - lat_range, lat + lat_range),
+                longitude__range=(lon - lon_range, lon + lon_range),
+            )
+            .annotate(distance_km=RawSQL(
+                "ST_Distance_Sphere(POINT(longitude, latitude), POINT(%s, %s)) / 1000.0",
+                (lon, lat),
+            ))
+            .filter(distance_km__lte=radius_km)
+            .order_by('distance_km')
         )
-        results = []
-        for f in facilities:
-            dist = _haversine(lat, lon, float(f.latitude), float(f.longitude))
-            if dist <= radius_km:
-                data = FacilityListSerializer(f).data
-                data['distance_km'] = round(dist, 3)
-                results.append(data)
-
-        results.sort(key=lambda x: x['distance_km'])
+        facilities = list(facilities)
+        results = FacilityListSerializer(facilities, many=True).data
+        for row, f in zip(results, facilities):
+            row['distance_km'] = round(f.distance_km, 3)
         return Response(results)
 
 
@@ -170,17 +217,37 @@ class MethaneHotspotViewSet(viewsets.ModelViewSet):
     @action(detail=False, methods=['get'])
     def stats(self, request):
         """Summary statistics for methane hotspots."""
-        qs = MethaneHotspot.objects.all()
-        total = qs.count()
-        if total == 0:
-            return Response({'total': 0})
-
-        severe = qs.filter(severity='Severe').count()
-        moderate = qs.filter(severity='Moderate').count()
-        low = qs.filter(severity='Low').count()
-
-        from django.db.models import Max, Min
-        agg = qs.aggregate(
+        latest_write = MethaneHotspot.objects.aggregate(
+            m=Max('created_at'))['m']
+        # Preferred path: the aggregate snapshotted at pipeline
+        # completion — one indexed row read instead of a table scan.
+        # Only valid while no hotspot write postdates it: a seed_data
+        # reseed (or a --clear leaving the table empty) must fall
+        # through to the live numbers, not replay the old snapshot.
+        snapshot = (
+            PipelineRun.objects
+            .filter(status='completed', hotspot_stats__isnull=False)
+            .order_by('-started_at')
+            .values_list('hotspot_stats', 'completed_at')
+            .first()
+        )
+        if snapshot is not None:
+            stats_blob, snapped_at = snapshot
+            if latest_write is not None and latest_write <= snapped_at:
+                return Response(stats_blob)
+        # Fallback: live aggregate, cached and keyed on the freshest
+        # write so a reseed rolls the key immediately
+        return Response(cache.get_or_set(
+            f'hotspots:stats:{latest_write}', self._build_stats, 300))
+
+    @staticmethod
+    def _build_stats():
+        # Single scan with filtered Counts instead of five COUNT round trips
+        agg = MethaneHotspot.objects.aggregate(
+            total=Count('id'),
+            severe=Count('id', filter=Q(severity='Severe')),
+            moderate=Count('id', filter=Q(severity='Moderate')),
+            low=Count('id', filter=Q(severity='Low')),
             max_count=Max('count'),
             min_count=Min('count'),
             avg_count=Avg('count'),
@@ -189,18 +256,21 @@ class MethaneHotspotViewSet(viewsets.ModelViewSet):
             min_lon=Min('longitude'),
             max_lon=Max('longitude'),
         )
+        total = agg['total']
+        if total == 0:
+            return {'total': 0}
 
-        return Response({
+        return {
             'total_hotspots': total,
-            'severe_count': severe,
-            'moderate_count': moderate,
-            'low_count': low,
+            'severe_count': agg['severe'],
+            'moderate_count': agg['moderate'],
+            'low_count': agg['low'],
             'max_count': agg['max_count'],
             'min_count': agg['min_count'],
             'avg_count': round(float(agg['avg_count']), 2),
             'lat_range': [float(agg['min_lat']), float(agg['max_lat'])],
             'lon_range': [float(agg['min_lon']), float(agg['max_lon'])],
-        })
+        }
 
 
 # ─── Detected Hotspot ViewSet ─────────────────────────────────────────────
@@ -209,6 +279,7 @@ class DetectedHotspotViewSet(viewsets.ModelViewSet):
     """Anomaly-filtered detected hotspots."""
     queryset = DetectedHotspot.objects.all()
     serializer_class = DetectedHotspotSerializer
+    pagination_class = DetectedAtCursorPagination
     permission_classes = [AllowAny]
     filter_backends = [DjangoFilterBackend, filters.OrderingFilter]
     filterset_fields = ['priority', 'severity', 'requires_highres', 'pipeline_run']
@@ -231,7 +302,7 @@ class PlumeObservationViewSet(viewsets.ModelViewSet):
 
 class AttributedEmissionViewSet(viewsets.ModelViewSet):
     """Spatial join results: plume → facility attribution."""
-    queryset = AttributedEmission.objects.select_related('facility', 'plume').all()
+    queryset = AttributedEmission.objects.all()
     serializer_class = AttributedEmissionSerializer
     permission_classes = [AllowAny]
     filter_backends = [DjangoFilterBackend, filters.OrderingFilter]
@@ -243,29 +314,44 @@ class AttributedEmissionViewSet(viewsets.ModelViewSet):
             return AttributedEmissionDetailSerializer
         return AttributedEmissionSerializer
 
+    def get_queryset(self):
+        # The serializer declares which relations it reads per row
+        return self.get_serializer_class().setup_eager_loading(super().get_queryset())
+
     @action(detail=False, methods=['get'])
     def metrics(self, request):
         """Pinpoint accuracy and emission metrics."""
-        qs = AttributedEmission.objects.all()
         run_id = request.query_params.get('pipeline_run')
+        latest = PipelineRun.objects.aggregate(m=Max('started_at'))['m']
+        key = f'attributions:metrics:{run_id or "all"}:{latest}'
+        return Response(cache.get_or_set(
+            key, lambda: self._build_metrics(run_id), 300))
+
+    @staticmethod
+    def _build_metrics(run_id):
+        qs = AttributedEmission.objects.all()
         if run_id:
             qs = qs.filter(pipeline_run_id=run_id)
 
-        total = qs.count()
-        if total == 0:
-            return Response({'total': 0})
-
-        high_conf = qs.filter(confidence='high').count()
-        medium_conf = qs.filter(confidence='medium').count()
-        low_conf = qs.filter(confidence='low').count()
-
+        # One aggregate instead of four COUNT queries plus the averages
         agg = qs.aggregate(
+            total=Count('id'),
+            high_conf=Count('id', filter=Q(confidence='high')),
+            medium_conf=Count('id', filter=Q(confidence='medium')),
+            low_conf=Count('id', filter=Q(confidence='low')),
             avg_distance=Avg('distance_km'),
             total_emission=Sum('emission_rate_kg_hr'),
             avg_emission=Avg('emission_rate_kg_hr'),
         )
+        total = agg['total']
+        if total == 0:
+            return {'total': 0}
 
-        return Response({
+        high_conf = agg['high_conf']
+        medium_conf = agg['medium_conf']
+        low_conf = agg['low_conf']
+
+        return {
             'total_attributions': total,
             'high_confidence': high_conf,
             'medium_confidence': medium_conf,
@@ -274,14 +360,43 @@ class AttributedEmissionViewSet(viewsets.ModelViewSet):
             'avg_pinpoint_distance_km': round(float(agg['avg_distance']), 3),
             'total_emission_rate_kg_hr': round(float(agg['total_emission']), 2),
             'avg_emission_rate_kg_hr': round(float(agg['avg_emission']), 2),
-        })
+        }
+
+    @action(detail=False, methods=['get'])
+    def export(self, request):
+        """
+        Stream the full (filtered) attribution table as one JSON array.
+
+        Bulk consumers were paging through every cursor page; this walks
+        the table with a server-side cursor and encodes row by row, so
+        memory stays flat no matter how large the table grows.
+        """
+        rows = self.filter_queryset(AttributedEmission.objects.all()).values(
+            'id', 'plume__plume_id', 'facility_id', 'facility_name',
+            'facility_type', 'facility_operator', 'distance_km',
+            'confidence', 'emission_rate_kg_hr', 'pipeline_run_id',
+            'attributed_at',
+        ).iterator(chunk_size=2000)
+
+        def body():
+            yield b'['
+            first = True
+            for r in rows:
+                if not first:
+                    yield b','
+                first = False
+                yield orjson.dumps(r, default=str)
+            yield b']'
+
+        return StreamingHttpResponse(body(), content_type='application/json')
 
 
 # ─── Inversion Result ViewSet ─────────────────────────────────────────────
 
 class InversionResultViewSet(viewsets.ModelViewSet):
     """Gaussian plume inversion results."""
-    queryset = InversionResult.objects.select_related('attribution').all()
+    # The serializer exposes attribution as a bare pk, so no joins needed
+    queryset = InversionResult.objects.all()
     serializer_class = InversionResultSerializer
     permission_classes = [AllowAny]
     filter_backends = [DjangoFilterBackend, filters.OrderingFilter]
@@ -291,30 +406,40 @@ class InversionResultViewSet(viewsets.ModelViewSet):
     @action(detail=False, methods=['get'])
     def accuracy(self, request):
         """Emission rate error metrics (evaluation metric)."""
-        qs = InversionResult.objects.exclude(error_pct__isnull=True)
         run_id = request.query_params.get('pipeline_run')
+        latest = PipelineRun.objects.aggregate(m=Max('started_at'))['m']
+        key = f'inversions:accuracy:{run_id or "all"}:{latest}'
+        return Response(cache.get_or_set(
+            key, lambda: self._build_accuracy(run_id), 300))
+
+    @staticmethod
+    def _build_accuracy(run_id):
+        qs = InversionResult.objects.exclude(error_pct__isnull=True)
         if run_id:
             qs = qs.filter(pipeline_run_id=run_id)
 
-        total = qs.count()
-        if total == 0:
-            return Response({'total': 0})
-
+        # One scan: total, converged, and error spread together
         agg = qs.aggregate(
+            total=Count('id'),
+            converged=Count('id', filter=Q(converged=True)),
             avg_error=Avg('error_pct'),
             max_error=Max('error_pct'),
             min_error=Min('error_pct'),
         )
-        converged = qs.filter(converged=True).count()
+        total = agg['total']
+        if total == 0:
+            return {'total': 0}
 
-        return Response({
+        converged = agg['converged']
+
+        return {
             'total_inversions': total,
             'converged': converged,
             'convergence_rate_pct': round(converged / total * 100, 1),
             'avg_emission_rate_error_pct': round(float(agg['avg_error']), 2),
             'max_error_pct': round(float(agg['max_error']), 2),
             'min_error_pct': round(float(agg['min_error']), 2),
-        })
+        }
 
 
 # ─── Tasking Request ViewSet ──────────────────────────────────────────────
@@ -333,8 +458,10 @@ class TaskingRequestViewSet(viewsets.ModelViewSet):
 
 class AuditReportViewSet(viewsets.ModelViewSet):
     """Compliance audit reports."""
-    queryset = AuditReport.objects.select_related('facility').all()
+    # facility_name is denormalized on the row, so no join needed for lists
+    queryset = AuditReport.objects.all()
     serializer_class = AuditReportSerializer
+    pagination_class = GeneratedAtCursorPagination
     permission_classes = [AllowAny]
     filter_backends = [DjangoFilterBackend, filters.SearchFilter, filters.OrderingFilter]
     filterset_fields = ['risk_level', 'confidence', 'facility', 'pipeline_run']
@@ -346,6 +473,14 @@ class AuditReportViewSet(viewsets.ModelViewSet):
             return AuditReportListSerializer
         return AuditReportSerializer
 
+    def get_queryset(self):
+        qs = super().get_queryset()
+        if self.action == 'list':
+            # The list serializer never reads the big text blobs
+            qs = qs.defer('report_markdown', 'full_report_html',
+                          'executive_summary_html')
+        return qs
+
 
 # ─── Pipeline Run ViewSet ─────────────────────────────────────────────────
 
@@ -363,12 +498,32 @@ class PipelineRunViewSet(viewsets.ModelViewSet):
             return PipelineRunDetailSerializer
         return PipelineRunSerializer
 
+    def get_queryset(self):
+        qs = super().get_queryset()
+        if self.action in ('retrieve', 'results'):
+            # One prefetch per nested collection instead of N+1 per child
+            qs = PipelineRunDetailSerializer.setup_eager_loading(qs)
+        return qs
+
     @action(detail=True, methods=['get'])
     def results(self, request, pk=None):
         """Full results for a pipeline run."""
         run = self.get_object()
         return Response(PipelineRunDetailSerializer(run).data)
 
+    @action(detail=True, methods=['get'])
+    def attributions(self, request, pk=None):
+        """
+        Paginated attributions for a run — cursor-paged alternative to the
+        fully inlined list in the detail payload.
+        """
+        qs = AttributedEmissionSerializer.setup_eager_loading(
+            AttributedEmission.objects.filter(pipeline_run_id=pk)
+        )
+        page = self.paginate_queryset(qs)
+        serializer = AttributedEmissionSerializer(page, many=True)
+        return self.get_paginated_response(serializer.data)
+
 
 # ─── Pipeline Trigger ──────────────────────────────────────────────────────
 
@@ -382,8 +537,6 @@ class PipelineTriggerView(APIView):
     permission_classes = [AllowAny]
 
     def post(self, request):
-        import threading
-
         serializer = PipelineTriggerSerializer(data=request.data)
         serializer.is_valid(raise_exception=True)
 
@@ -435,7 +588,6 @@ _STEP_META = {
 }
 
 def _step_hdr(n, run_pk):
-    import time
     icon, short, desc = _STEP_META[n]
     W = 70
     print(_pc("═" * W, _C.BLUE))
@@ -445,7 +597,6 @@ def _step_hdr(n, run_pk):
     return time.time()
 
 def _step_done(t0, label=""):
-    import time
     elapsed = time.time() - t0
     tag = f" — {label}" if label else ""
     print(_pc(f"\n  ✔  Done{tag}  [{elapsed:.2f}s]\n", _C.GREEN))
@@ -453,10 +604,45 @@ def _step_done(t0, label=""):
 def _hdiv(c="─", w=66): print(f"  {_C.DIM}{c*w}{_C.RESET}")
 
 
+@functools.lru_cache(maxsize=1)
+def _pipeline_modules():
+    """
+    Import the src.* pipeline stack once per process. These pull in torch,
+    rasterio, and friends, so the cost is paid on the first trigger only;
+    the sys.path setup has to happen before the imports, which is why they
+    can't live at module scope.
+    """
+    from types import SimpleNamespace
+
+    project_root = str(settings.PROJECT_ROOT)
+    if project_root not in sys.path:
+        sys.path.insert(0, project_root)
+
+    from src.config import config
+    from src.data.sentinel5p import Sentinel5PClient
+    from src.data.carbonmapper import CarbonMapperClient
+    from src.data.infrastructure import InfrastructureDB
+    from src.fusion.hotspot_detector import HotspotDetector
+    from src.fusion.tasking_simulator import TaskingSimulator
+    from src.fusion.spatial_join import SpatialJoiner
+    from src.plume.inversion import PlumeInverter
+    from src.plume.wind import WindField
+
+    return SimpleNamespace(
+        config=config,
+        Sentinel5PClient=Sentinel5PClient,
+        CarbonMapperClient=CarbonMapperClient,
+        InfrastructureDB=InfrastructureDB,
+        HotspotDetector=HotspotDetector,
+        TaskingSimulator=TaskingSimulator,
+        SpatialJoiner=SpatialJoiner,
+        PlumeInverter=PlumeInverter,
+        WindField=WindField,
+    )
+
+
 def _run_pipeline_background(run_pk, mode, use_llm):
     """Execute the full pipeline in a background thread with rich terminal output."""
-    import time
-    import numpy as np
     from django.utils import timezone as tz
 
     run = PipelineRun.objects.get(pk=run_pk)
@@ -479,19 +665,16 @@ def _run_pipeline_background(run_pk, mode, use_llm):
     print(f"  {_C.BOLD}Started:{_C.RESET} {datetime.now().strftime('%Y-%m-%d  %H:%M:%S')}\n")
 
     try:
-        project_root = str(settings.PROJECT_ROOT)
-        if project_root not in sys.path:
-            sys.path.insert(0, project_root)
-
-        from src.config import config
-        from src.data.sentinel5p import Sentinel5PClient
-        from src.data.carbonmapper import CarbonMapperClient
-        from src.data.infrastructure import InfrastructureDB
-        from src.fusion.hotspot_detector import HotspotDetector
-        from src.fusion.tasking_simulator import TaskingSimulator
-        from src.fusion.spatial_join import SpatialJoiner
-        from src.plume.inversion import PlumeInverter
-        from src.plume.wind import WindField
+        mods = _pipeline_modules()
+        config = mods.config
+        Sentinel5PClient = mods.Sentinel5PClient
+        CarbonMapperClient = mods.CarbonMapperClient
+        InfrastructureDB = mods.InfrastructureDB
+        HotspotDetector = mods.HotspotDetector
+        TaskingSimulator = mods.TaskingSimulator
+        SpatialJoiner = mods.SpatialJoiner
+        PlumeInverter = mods.PlumeInverter
+        WindField = mods.WindField
 
         use_demo = (mode == 'demo')
 
@@ -748,7 +931,8 @@ def _run_pipeline_background(run_pk, mode, use_llm):
 
         inverter     = PlumeInverter(stability_class="D")
         wind         = WindField(use_live=not use_demo)
-        top_emitters = sorted(attributions, key=lambda a: a.emission_rate_kg_hr, reverse=True)[:5]
+        # O(N log 5) selection instead of sorting all attributions
+        top_emitters = heapq.nlargest(5, attributions, key=lambda a: a.emission_rate_kg_hr)
 
         # DB storage (silent)
         _run_and_store_inversions(top_emitters, inverter, wind, run)
@@ -817,7 +1001,7 @@ def _run_pipeline_background(run_pk, mode, use_llm):
             try:
                 from src.agent.reporting_agent import ComplianceAuditAgent
                 agent          = ComplianceAuditAgent(model=config.ollama_model, base_url=config.ollama_base_url)
-                top_for_report = sorted(attributions, key=lambda a: a.emission_rate_kg_hr, reverse=True)[:3]
+                top_for_report = heapq.nlargest(3, attributions, key=lambda a: a.emission_rate_kg_hr)
                 plume_map      = {p.plume_id: p for p in plumes}
                 reports        = agent.generate_batch_reports(top_for_report, plume_map)
                 run.reports_count = len(reports)
@@ -844,9 +1028,12 @@ def _run_pipeline_background(run_pk, mode, use_llm):
         # FINAL SUMMARY
         # ════════════════════════════════════════════════════════════════
         total_elapsed = time.time() - pipeline_start
-        run.status       = 'completed'
-        run.completed_at = tz.now()
-        run.save(update_fields=['status', 'completed_at'])
+        run.status        = 'completed'
+        run.completed_at  = tz.now()
+        # Snapshot the hotspot aggregate now, while it's cheap to take,
+        # so the stats endpoint serves it as a single-row read
+        run.hotspot_stats = MethaneHotspotViewSet._build_stats()
+        run.save(update_fields=['status', 'completed_at', 'hotspot_stats'])
 
         print(_pc("═" * W, _C.CYAN))
         print(_pc(f"  🏁  PIPELINE COMPLETE  —  Run #{run_pk}", _C.BOLD + _C.WHITE))
@@ -883,27 +1070,42 @@ class DashboardSummaryView(APIView):
     """
     GET /api/dashboard/summary/
 
-    Aggregated metrics for the React dashboard.
+    Aggregated metrics for the React dashboard. The payload only changes
+    when a pipeline run completes or facilities are reseeded, so it is
+    cached under a key derived from those timestamps — new data rolls the
+    key, which makes explicit invalidation unnecessary.
     """
     permission_classes = [AllowAny]
 
     def get(self, request):
+        # Two cheap MAX() probes version the cache key
+        latest_run = PipelineRun.objects.aggregate(m=Max('completed_at'))['m']
+        latest_fac = Facility.objects.aggregate(m=Max('updated_at'))['m']
+        key = f'dashboard:v1:{latest_run}:{latest_fac}'
+        return Response(cache.get_or_set(key, self._build_summary, 300))
+
+    def _build_summary(self):
         # Issue 7: Optimized — use aggregate to minimize query count
         # Single query for facility type distribution
-        facility_stats = Facility.objects.aggregate(
-            total=Count('id'),
-        )
-        total_facilities = facility_stats['total']
-        type_dist = dict(
-            Facility.objects.values_list('type')
-            .annotate(c=Count('id'))
-            .values_list('type', 'c')
-        )
-        operator_dist = dict(
-            Facility.objects.values_list('operator')
-            .annotate(c=Count('id'))
-            .values_list('operator', 'c')
-        )
+        # Facility distributions change only on (re)seed, so they get their
+        # own 60 s cache entry that outlives the 30 s page cache
+        def _facility_distributions():
+            return {
+                'type': {
+                    r['type']: r['c']
+                    for r in Facility.objects.values('type').annotate(c=Count('id'))
+                },
+                'operator': {
+                    r['operator']: r['c']
+                    for r in Facility.objects.values('operator').annotate(c=Count('id'))
+                },
+            }
+
+        dist = cache.get_or_set('dashboard:distributions',
+                                _facility_distributions, 60)
+        type_dist = dist['type']
+        operator_dist = dist['operator']
+        total_facilities = sum(type_dist.values())
 
         # Single aggregate query for hotspot + detected stats
         hotspot_agg = DetectedHotspot.objects.aggregate(
@@ -927,17 +1129,16 @@ class DashboardSummaryView(APIView):
 
         # Reports
         total_reports = AuditReport.objects.count()
-        recent_reports = AuditReport.objects.select_related('facility').order_by('-generated_at')[:5]
-
-        # Top emitting facilities
-        top_emitter_ids = (
-            AttributedEmission.objects
-            .values('facility')
-            .annotate(total_emission=Sum('emission_rate_kg_hr'))
+        recent_reports = AuditReport.objects.order_by('-generated_at')[:5]
+
+        # Top emitting facilities — one JOIN + GROUP BY instead of the
+        # two-step id-fetch-then-filter (which also dropped the ordering)
+        top_emitters = (
+            Facility.objects
+            .annotate(total_emission=Sum('attributions__emission_rate_kg_hr'))
+            .filter(total_emission__isnull=False)
             .order_by('-total_emission')[:10]
         )
-        top_facility_ids = [e['facility'] for e in top_emitter_ids]
-        top_emitters = Facility.objects.filter(id__in=top_facility_ids)
 
         # Pipeline runs
         total_runs = PipelineRun.objects.count()
@@ -954,7 +1155,7 @@ class DashboardSummaryView(APIView):
             'Low':      0,
         }
 
-        return Response({
+        return {
             'total_facilities': total_facilities,
             'total_hotspots': total_hotspots,
             'total_detected': total_detected,
@@ -976,7 +1177,7 @@ class DashboardSummaryView(APIView):
                 'started_at': last_run.started_at.isoformat(),
                 'completed_at': last_run.completed_at.isoformat() if last_run.completed_at else None,
             } if last_run else None,
-        })
+        }
 
 
 # ─── Dashboard Trend ─────────────────────────────────────────────────────
@@ -1040,103 +1241,182 @@ class DashboardTrendView(APIView):
 
 
 # ─── GeoJSON Export Endpoints ─────────────────────────────────────────────
+#
+# The map layers only change when data is (re)seeded or a pipeline run
+# finishes, so each endpoint gets a Last-Modified timestamp for cheap
+# 304s; cold hits stream .values() rows straight through orjson without
+# ever materializing model instances or the full response body.
+
+def _facilities_last_modified(request):
+    return Facility.objects.aggregate(m=Max('updated_at'))['m']
+
+
+def _pipeline_last_modified(request):
+    run = (
+        PipelineRun.objects.order_by('-started_at')
+        .values_list('completed_at', 'started_at')
+        .first()
+    )
+    if run is None:
+        return None
+    return run[0] or run[1]
+
+
+def _hotspots_last_modified(request):
+    # Hotspots are mostly written by seed_data, which creates no run —
+    # fold the freshest row write in so a reseed moves Last-Modified
+    stamps = [
+        _pipeline_last_modified(request),
+        MethaneHotspot.objects.aggregate(m=Max('created_at'))['m'],
+    ]
+    stamps = [s for s in stamps if s is not None]
+    return max(stamps) if stamps else None
+
 
+# Hard cap per request — clients should narrow with ?bbox= instead
+_GEOJSON_MAX_FEATURES = 10000
+
+
+def _bbox_filter(qs, request, lat_field='latitude', lon_field='longitude'):
+    """
+    Restrict a queryset to ?bbox=minlon,minlat,maxlon,maxlat (the map
+    viewport) via the lat/lng composite indexes. Ignored when absent or
+    malformed.
+    """
+    bbox = request.query_params.get('bbox')
+    if not bbox:
+        return qs
+    try:
+        min_lon, min_lat, max_lon, max_lat = (float(v) for v in bbox.split(','))
+    except ValueError:
+        return qs
+    return qs.filter(**{
+        f'{lon_field}__range': (min_lon, max_lon),
+        f'{lat_field}__range': (min_lat, max_lat),
+    })
+
+
+def _stream_geojson(features):
+    """Yield a GeoJSON FeatureCollection as orjson-encoded chunks."""
+    yield b'{"type":"FeatureCollection","features":['
+    first = True
+    for feat in features:
+        if not first:
+            yield b','
+        first = False
+        yield orjson.dumps(feat)
+    yield b']}'
+
+
+@condition(last_modified_func=_facilities_last_modified)
 @api_view(['GET'])
 @perm_classes_decorator([AllowAny])
 def facilities_geojson(request):
-    """Export facilities as GeoJSON FeatureCollection."""
-    facilities = Facility.objects.all()
-    features = []
-    for f in facilities:
-        features.append({
-            'type': 'Feature',
-            'geometry': {
-                'type': 'Point',
-                'coordinates': [float(f.longitude), float(f.latitude)],
-            },
-            'properties': {
-                'id': f.pk,
-                'facility_id': f.facility_id,
-                'name': f.name,
-                'type': f.type,
-                'operator': f.operator,
-                'status': f.status,
-            },
-        })
-    return Response({
-        'type': 'FeatureCollection',
-        'features': features,
-    })
+    """Export facilities as GeoJSON FeatureCollection (streamed)."""
+    rows = _bbox_filter(Facility.objects.all(), request).values(
+        'id', 'facility_id', 'name', 'type', 'operator', 'status',
+        'longitude', 'latitude',
+    )[:_GEOJSON_MAX_FEATURES].iterator(chunk_size=5000)
+
+    def features():
+        for r in rows:
+            yield {
+                'type': 'Feature',
+                'geometry': {
+                    'type': 'Point',
+                    'coordinates': [r['longitude'], r['latitude']],
+                },
+                'properties': {
+                    'id': r['id'],
+                    'facility_id': r['facility_id'],
+                    'name': r['name'],
+                    'type': r['type'],
+                    'operator': r['operator'],
+                    'status': r['status'],
+                },
+            }
+
+    return StreamingHttpResponse(_stream_geojson(features()),
+                                 content_type='application/json')
 
 
+@condition(last_modified_func=_hotspots_last_modified)
 @api_view(['GET'])
 @perm_classes_decorator([AllowAny])
 def hotspots_geojson(request):
-    """Export methane hotspots as GeoJSON FeatureCollection."""
-    hotspots = MethaneHotspot.objects.all()
-    features = []
-    for h in hotspots:
-        features.append({
-            'type': 'Feature',
-            'geometry': {
-                'type': 'Point',
-                'coordinates': [float(h.longitude), float(h.latitude)],
-            },
-            'properties': {
-                'id': h.pk,
-                'system_index': h.system_index,
-                'count': h.count,
-                'severity': h.severity,
-            },
-        })
-    return Response({
-        'type': 'FeatureCollection',
-        'features': features,
-    })
+    """Export methane hotspots as GeoJSON FeatureCollection (streamed)."""
+    rows = _bbox_filter(MethaneHotspot.objects.all(), request).values(
+        'id', 'system_index', 'count', 'severity', 'longitude', 'latitude',
+    )[:_GEOJSON_MAX_FEATURES].iterator(chunk_size=5000)
+
+    def features():
+        for r in rows:
+            yield {
+                'type': 'Feature',
+                'geometry': {
+                    'type': 'Point',
+                    'coordinates': [r['longitude'], r['latitude']],
+                },
+                'properties': {
+                    'id': r['id'],
+                    'system_index': r['system_index'],
+                    'count': r['count'],
+                    'severity': r['severity'],
+                },
+            }
+
+    return StreamingHttpResponse(_stream_geojson(features()),
+                                 content_type='application/json')
 
 
+@condition(last_modified_func=_pipeline_last_modified)
 @api_view(['GET'])
 @perm_classes_decorator([AllowAny])
 def attributions_geojson(request):
     """Export attributed emissions as GeoJSON with lines from plume→facility."""
-    attributions = AttributedEmission.objects.select_related('facility', 'plume').all()
-    features = []
-    for a in attributions:
-        # Plume point
-        features.append({
-            'type': 'Feature',
-            'geometry': {
-                'type': 'Point',
-                'coordinates': [float(a.plume.longitude), float(a.plume.latitude)],
-            },
-            'properties': {
-                'type': 'plume',
-                'plume_id': a.plume.plume_id,
-                'emission_rate_kg_hr': a.emission_rate_kg_hr,
-                'confidence': a.confidence,
-            },
-        })
-        # Line from plume to facility
-        features.append({
-            'type': 'Feature',
-            'geometry': {
-                'type': 'LineString',
-                'coordinates': [
-                    [float(a.plume.longitude), float(a.plume.latitude)],
-                    [float(a.facility.longitude), float(a.facility.latitude)],
-                ],
-            },
-            'properties': {
-                'type': 'attribution_line',
-                'distance_km': a.distance_km,
-                'confidence': a.confidence,
-                'facility_name': a.facility.name,
-            },
-        })
-    return Response({
-        'type': 'FeatureCollection',
-        'features': features,
-    })
+    rows = _bbox_filter(
+        AttributedEmission.objects.all(), request,
+        lat_field='plume__latitude', lon_field='plume__longitude',
+    ).values(
+        'distance_km', 'confidence', 'emission_rate_kg_hr', 'facility_name',
+        'plume__plume_id', 'plume__longitude', 'plume__latitude',
+        'facility__longitude', 'facility__latitude',
+    )[:_GEOJSON_MAX_FEATURES].iterator(chunk_size=5000)
+
+    def features():
+        for r in rows:
+            plume_coords = [r['plume__longitude'], r['plume__latitude']]
+            # Plume point
+            yield {
+                'type': 'Feature',
+                'geometry': {'type': 'Point', 'coordinates': plume_coords},
+                'properties': {
+                    'type': 'plume',
+                    'plume_id': r['plume__plume_id'],
+                    'emission_rate_kg_hr': r['emission_rate_kg_hr'],
+                    'confidence': r['confidence'],
+                },
+            }
+            # Line from plume to facility
+            yield {
+                'type': 'Feature',
+                'geometry': {
+                    'type': 'LineString',
+                    'coordinates': [
+                        plume_coords,
+                        [r['facility__longitude'], r['facility__latitude']],
+                    ],
+                },
+                'properties': {
+                    'type': 'attribution_line',
+                    'distance_km': r['distance_km'],
+                    'confidence': r['confidence'],
+                    'facility_name': r['facility_name'],
+                },
+            }
+
+    return StreamingHttpResponse(_stream_geojson(features()),
+                                 content_type='application/json')
 
 
 # ─── DB-based Heatmap Fallback ────────────────────────────────────────────
@@ -1157,8 +1437,6 @@ def heatmap_fallback(request):
             "raw_points": [[lat, lng, raw_value], ...],
         }
     """
-    import numpy as np
-
     print('\n[DB-FALLBACK] ─────────────────────────────────────────')
     print('[DB-FALLBACK] heatmap_fallback called')
 
@@ -1243,6 +1521,26 @@ def heatmap_fallback(request):
 
 # ─── Google Earth Engine Endpoints ─────────────────────────────────────────
 
+# Attribution + vis params never change at runtime — encode that fragment
+# once and splice only the volatile fields in per request.
+_TILE_STATIC_JSON = None
+
+
+def _tile_response_json(result: dict) -> str:
+    global _TILE_STATIC_JSON
+    if _TILE_STATIC_JSON is None:
+        from .gee_service import CH4_VIS_PARAMS
+        _TILE_STATIC_JSON = (
+            '"attribution":"Copernicus Sentinel-5P TROPOMI / Google Earth Engine",'
+            '"vis_params":' + orjson.dumps(CH4_VIS_PARAMS).decode()
+        )
+    return (
+        '{"tile_url":"%s",%s,"start_date":"%s","end_date":"%s","days":%d}'
+        % (result['tile_url'], _TILE_STATIC_JSON,
+           result['start_date'], result['end_date'], result['days'])
+    )
+
+
 @api_view(['GET'])
 @perm_classes_decorator([AllowAny])
 def gee_ch4_tiles(request):
@@ -1253,6 +1551,15 @@ def gee_ch4_tiles(request):
     """
     days = int(request.query_params.get('days', 30))
 
+    # The tile URL template only changes when the averaging window or the
+    # date bucket changes — a strong ETag lets Leaflet/CDNs revalidate with
+    # a 304 instead of re-running the GEE lookup.
+    etag = hashlib.blake2b(
+        f'{days}|{date.today().isoformat()}'.encode(), digest_size=16
+    ).hexdigest()
+    if request.headers.get('If-None-Match') == etag:
+        return Response(status=status.HTTP_304_NOT_MODIFIED, headers={'ETag': etag})
+
     print(f'\n[GEE-TILES] ─────────────────────────────────────────')
     print(f'[GEE-TILES] gee_ch4_tiles called  days={days}')
     try:
@@ -1260,7 +1567,11 @@ def gee_ch4_tiles(request):
         result = get_tile_url(days=days)
         print(f'[GEE-TILES] ✔ tile_url generated: {str(result.get("tile_url", ""))[:80]}...')
         print('[GEE-TILES] ─────────────────────────────────────────\n')
-        return Response(result)
+        response = HttpResponse(
+            _tile_response_json(result), content_type='application/json')
+        response['ETag'] = etag
+        response['Cache-Control'] = 'public, max-age=900, stale-while-revalidate=3600'
+        return response
     except Exception as e:
         print(f'[GEE-TILES] ✗ FAILED  {type(e).__name__}: {e}')
         print('[GEE-TILES] ─────────────────────────────────────────\n')
@@ -1270,6 +1581,49 @@ def gee_ch4_tiles(request):
         )
 
 
+@api_view(['GET'])
+@perm_classes_decorator([AllowAny])
+def gee_ch4_map(request):
+    """
+    Combined tile URL + heatmap points for one map load.
+
+    LiveMap needs both on mount; gee_service overlaps the two GEE
+    round-trips so this costs roughly the slower of the two instead of
+    their sum. Either side may come back null — the frontend keeps
+    whichever half succeeded.
+    Query params:
+        days       – number of days to average (default 30)
+        num_points – max heatmap sample points (default 1000)
+        scale      – sampling resolution in metres (default 20000)
+    """
+    days = int(request.query_params.get('days', 30))
+    num_points = int(request.query_params.get('num_points', 1000))
+    scale = int(request.query_params.get('scale', 20000))
+
+    print(f'\n[GEE-MAP] ───────────────────────────────────────────')
+    print(f'[GEE-MAP] gee_ch4_map called  days={days}  num_points={num_points}  scale={scale}')
+    try:
+        from .gee_service import get_map_payload
+        result = get_map_payload(days=days, num_points=num_points, scale=scale)
+        n_pts = len((result.get('heatmap') or {}).get('points', []))
+        tile_ok = bool((result.get('tiles') or {}).get('tile_url'))
+        print(f'[GEE-MAP] ✔ tiles={"ok" if tile_ok else "none"}  heatmap points={n_pts}')
+        print('[GEE-MAP] ───────────────────────────────────────────\n')
+        if result.get('tiles') is None and result.get('heatmap') is None:
+            return Response(
+                {'error': 'unavailable', 'detail': 'Both GEE calls failed. Check Earth Engine authentication.'},
+                status=status.HTTP_503_SERVICE_UNAVAILABLE,
+            )
+        return OrjsonResponse(result)
+    except Exception as e:
+        print(f'[GEE-MAP] ✗ FAILED  {type(e).__name__}: {e}')
+        print('[GEE-MAP] ───────────────────────────────────────────\n')
+        return Response(
+            {'error': type(e).__name__, 'detail': str(e)},
+            status=status.HTTP_503_SERVICE_UNAVAILABLE,
+        )
+
+
 @api_view(['GET'])
 @perm_classes_decorator([AllowAny])
 def gee_ch4_heatmap(request):
@@ -1298,10 +1652,10 @@ def gee_ch4_heatmap(request):
         _log.info('[GEE] ch4-heatmap: returned %d points', n_pts)
         print(f'[GEE-HEATMAP] ✔ GEE returned {n_pts} points')
         print(f'[GEE-HEATMAP] Stats  : {result.get("stats")}')
-        if result.get('points'):
+        if n_pts:
             print(f'[GEE-HEATMAP] Sample (first 3): {result["points"][:3]}')
         print('[GEE-HEATMAP] ───────────────────────────────────────\n')
-        return Response(result)
+        return OrjsonResponse(result)
     except TimeoutError as e:
         _log.warning('[GEE] ch4-heatmap timed out: %s', e)
         print(f'[GEE-HEATMAP] ✗ TIMEOUT after {e}')
@@ -1512,34 +1866,43 @@ def gee_company_analysis(request):
 # ─── Helper functions ─────────────────────────────────────────────────────
 
 def _haversine(lat1, lon1, lat2, lon2):
-    """Haversine distance in km."""
+    """
+    Haversine distance in km. NumPy-vectorized: any argument may be an
+    ndarray, so bulk callers pay one C loop instead of per-row Python trig
+    (the nearby endpoint itself now computes distance in SQL).
+    """
     R = 6371.0
-    dlat = radians(lat2 - lat1)
-    dlon = radians(lon2 - lon1)
-    a = sin(dlat / 2) ** 2 + cos(radians(lat1)) * cos(radians(lat2)) * sin(dlon / 2) ** 2
-    return R * 2 * atan2(sqrt(a), sqrt(1 - a))
+    lat1, lat2 = np.radians(lat1), np.radians(lat2)
+    dlat = lat2 - lat1
+    dlon = np.radians(np.subtract(lon2, lon1))
+    a = np.sin(dlat / 2) ** 2 + np.cos(lat1) * np.cos(lat2) * np.sin(dlon / 2) ** 2
+    return R * 2 * np.arctan2(np.sqrt(a), np.sqrt(1 - a))
 
 
+@transaction.atomic
 def _store_raw_hotspots(hotspots_df):
-    """Bulk-insert raw methane hotspots (skip duplicates)."""
-    existing = set(MethaneHotspot.objects.values_list('system_index', flat=True))
-    objs = []
-    for _, row in hotspots_df.iterrows():
-        idx = str(row.get('system_index', row.name))
-        if idx in existing:
-            continue
-        objs.append(MethaneHotspot(
-            system_index=idx,
-            count=int(row['count']),
-            label=int(row.get('label', 1)),
-            latitude=row['latitude'],
-            longitude=row['longitude'],
-            severity=row.get('severity', ''),
-        ))
+    """Bulk-insert raw methane hotspots (DB dedupes on system_index)."""
+    # system_index is unique, so ignore_conflicts handles dedupe — no need
+    # to pre-fetch every existing index. itertuples avoids the per-row
+    # Series construction that makes iterrows ~100x slower.
+    objs = [
+        MethaneHotspot(
+            system_index=str(getattr(t, 'system_index', t.Index)),
+            count=int(t.count),
+            label=int(getattr(t, 'label', 1)),
+            latitude=t.latitude,
+            longitude=t.longitude,
+            severity=getattr(t, 'severity', ''),
+        )
+        for t in hotspots_df.itertuples(index=True)
+    ]
     if objs:
-        MethaneHotspot.objects.bulk_create(objs, ignore_conflicts=True)
+        MethaneHotspot.objects.bulk_create(objs, batch_size=1000,
+                                           ignore_conflicts=True)
 
 
+# Not @transaction.atomic: the Twilio dispatch below must not run inside
+# (and hold open) a DB transaction; the single bulk_create is atomic anyway.
 def _store_detected_hotspots(detected, run):
     """Store detected hotspot results and fire Twilio SMS alerts."""
     objs          = []
@@ -1583,6 +1946,7 @@ def _store_detected_hotspots(detected, run):
             print(_pc(f"  [SMS] Alert dispatch error: {_sms_exc}", _C.YELLOW))
 
 
+@transaction.atomic
 def _store_tasking_requests(requests, run):
     """Store satellite tasking requests."""
     objs = []
@@ -1600,6 +1964,7 @@ def _store_tasking_requests(requests, run):
         TaskingRequest.objects.bulk_create(objs, ignore_conflicts=True)
 
 
+@transaction.atomic
 def _store_plumes(plumes, run, is_synthetic=True):
     """Store plume observations."""
     objs = []
@@ -1621,27 +1986,48 @@ def _store_plumes(plumes, run, is_synthetic=True):
         PlumeObservation.objects.bulk_create(objs, ignore_conflicts=True)
 
 
+@transaction.atomic
 def _store_attributions(attributions, run):
     """Store spatial join attributions."""
+    # Two bulk lookups + one bulk_create instead of 3 queries per row
+    plume_map = {
+        p.plume_id: p for p in PlumeObservation.objects.filter(
+            plume_id__in={a.plume_id for a in attributions})
+    }
+    fac_map = {
+        f.facility_id: f for f in Facility.objects.filter(
+            facility_id__in={a.facility_id for a in attributions})
+    }
+    objs = []
     for a in attributions:
-        # Look up plume and facility in DB
-        plume = PlumeObservation.objects.filter(plume_id=a.plume_id).first()
-        facility = Facility.objects.filter(facility_id=a.facility_id).first()
+        plume = plume_map.get(a.plume_id)
+        facility = fac_map.get(a.facility_id)
         if plume and facility:
-            AttributedEmission.objects.create(
+            objs.append(AttributedEmission(
                 plume=plume,
                 facility=facility,
+                facility_name=facility.name,
+                facility_type=facility.type,
+                facility_operator=facility.operator,
                 distance_km=a.distance_km,
                 confidence=a.confidence,
                 emission_rate_kg_hr=a.emission_rate_kg_hr,
                 pipeline_run=run,
-            )
+            ))
+    if objs:
+        AttributedEmission.objects.bulk_create(objs, batch_size=500)
 
 
 def _run_and_store_inversions(top_emitters, inverter, wind, run):
     """Run plume inversion for top emitters and store results."""
-    import numpy as np
-
+    # One query maps every (plume_id, facility_id) pair for this run, so the
+    # loop below only spends time on the inversions themselves
+    attr_map = {
+        (a.plume.plume_id, a.facility.facility_id): a
+        for a in AttributedEmission.objects.filter(pipeline_run=run)
+        .select_related('plume', 'facility')
+    }
+    results = []
     for attr in top_emitters:
         try:
             wind_data = wind.get_wind(attr.latitude, attr.longitude)
@@ -1670,31 +2056,30 @@ def _run_and_store_inversions(top_emitters, inverter, wind, run):
                 true_Q_kg_hr=attr.emission_rate_kg_hr,
             )
 
-            # Find DB attribution
-            plume_obj = PlumeObservation.objects.filter(plume_id=attr.plume_id).first()
-            facility_obj = Facility.objects.filter(facility_id=attr.facility_id).first()
-            if plume_obj and facility_obj:
-                db_attr = AttributedEmission.objects.filter(
-                    plume=plume_obj, facility=facility_obj, pipeline_run=run
-                ).first()
-                if db_attr:
-                    InversionResult.objects.create(
-                        attribution=db_attr,
-                        estimated_q_kg_hr=result.estimated_Q_kg_hr,
-                        estimated_q_kg_s=result.estimated_Q_kg_s,
-                        true_q_kg_hr=result.true_Q_kg_hr,
-                        error_pct=result.error_pct,
-                        ci_lower_kg_hr=result.confidence_interval[0],
-                        ci_upper_kg_hr=result.confidence_interval[1],
-                        final_loss=result.final_loss,
-                        n_iterations=result.n_iterations,
-                        converged=result.converged,
-                        pipeline_run=run,
-                    )
+            # Find DB attribution in the prefetched map
+            db_attr = attr_map.get((attr.plume_id, attr.facility_id))
+            if db_attr:
+                results.append(InversionResult(
+                    attribution=db_attr,
+                    estimated_q_kg_hr=result.estimated_Q_kg_hr,
+                    estimated_q_kg_s=result.estimated_Q_kg_s,
+                    true_q_kg_hr=result.true_Q_kg_hr,
+                    error_pct=result.error_pct,
+                    ci_lower_kg_hr=result.confidence_interval[0],
+                    ci_upper_kg_hr=result.confidence_interval[1],
+                    final_loss=result.final_loss,
+                    n_iterations=result.n_iterations,
+                    converged=result.converged,
+                    pipeline_run=run,
+                ))
         except Exception:
             continue
 
+    if results:
+        InversionResult.objects.bulk_create(results, batch_size=500)
 
+
+@transaction.atomic
 def _store_reports(reports, run):
     """Store audit reports in DB."""
     import re as _re
@@ -1702,8 +2087,14 @@ def _store_reports(reports, run):
     _RISK_MAP = {'CRITICAL': 'CRITICAL', 'HIGH': 'HIGH', 'MEDIUM': 'MEDIUM', 'LOW': 'LOW'}
     _CONF_MAP = {'CRITICAL': 'high', 'HIGH': 'high', 'MEDIUM': 'medium', 'LOW': 'low'}
 
+    # Bulk facility lookup instead of one SELECT per report
+    fac_map = {
+        f.facility_id: f for f in Facility.objects.filter(
+            facility_id__in={r.facility_id for r in reports})
+    }
+
     for report in reports:
-        facility = Facility.objects.filter(facility_id=report.facility_id).first()
+        facility = fac_map.get(report.facility_id)
         if not facility:
             continue
 
@@ -1734,6 +2125,7 @@ def _store_reports(reports, run):
             report_id=report.report_id,
             defaults={
                 'facility':            facility,
+                'facility_name':       facility.name,
                 'attribution':         None,
                 'emission_rate_kg_hr': report.emission_rate_kg_hr,
                 'risk_level':          risk_level,
@@ -54,8 +54,13 @@ INSTALLED_APPS = [
 
 MIDDLEWARE = [
     'django.middleware.security.SecurityMiddleware',
+    # Compress JSON/geojson responses (placed early so it wraps everything
+    # below, including conditional-GET 304 handling)
+    'django.middleware.gzip.GZipMiddleware',
     'corsheaders.middleware.CorsMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
+    # Turns ETag matches (e.g. the CH4 tile endpoint) into automatic 304s
+    'django.middleware.http.ConditionalGetMiddleware',
     'django.middleware.common.CommonMiddleware',
     'django.middleware.csrf.CsrfViewMiddleware',
     'django.contrib.auth.middleware.AuthenticationMiddleware',
@@ -94,9 +99,16 @@ DATABASES = {
         'PASSWORD': os.getenv('DB_PASSWORD'),
         'HOST': os.getenv('DB_HOST', 'localhost'),
         'PORT': os.getenv('DB_PORT', '3306'),
+        # Reuse connections across requests instead of paying the MySQL
+        # TCP+auth handshake on every one; health checks catch connections
+        # the server dropped in the meantime (wait_timeout)
+        'CONN_MAX_AGE': 300,
+        'CONN_HEALTH_CHECKS': True,
         'OPTIONS': {
             'charset': 'utf8mb4',
             'init_command': "SET sql_mode='STRICT_TRANS_TABLES'",
+            # Lets seed_data use LOAD DATA LOCAL INFILE for CSV ingest
+            'local_infile': True,
         },
     }
 }
@@ -147,7 +159,8 @@ DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'
 # ─── Django REST Framework ─────────────────────────────────────────────────
 
 REST_FRAMEWORK = {
-    'DEFAULT_PAGINATION_CLASS': 'rest_framework.pagination.PageNumberPagination',
+    # Cursor-based — flat latency regardless of table size (api/pagination.py)
+    'DEFAULT_PAGINATION_CLASS': 'api.pagination.IdCursorPagination',
     'PAGE_SIZE': int(os.getenv('DRF_PAGE_SIZE', '50')),
     'DEFAULT_FILTER_BACKENDS': [
         'django_filters.rest_framework.DjangoFilterBackend',
@@ -155,7 +168,8 @@ REST_FRAMEWORK = {
         'rest_framework.filters.OrderingFilter',
     ],
     'DEFAULT_RENDERER_CLASSES': [
-        'rest_framework.renderers.JSONRenderer',
+        # orjson-backed — see api/renderers.py
+        'api.renderers.ORJSONRenderer',
         'rest_framework.renderers.BrowsableAPIRenderer',
     ],
     # Issue 1: Global authentication — all endpoints require a valid token